@@ -35,11 +35,12 @@ class UserAdmin(BaseUserAdmin):
         'created_at'
     ]
     
-    # Fields to search
+    # Fetch related rows in the changelist query instead of per row
+    list_select_related = True
+    
+    # Fields to search (backed by trigram indexes on PostgreSQL)
     search_fields = [
         'email',
-        'name',
-        'phone',
         'badge_number'
     ]
     
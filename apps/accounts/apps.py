@@ -5,6 +5,7 @@ This app handles user management and authentication for the Fire Watcher system.
 """
 
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class AccountsConfig(AppConfig):
@@ -12,3 +13,18 @@ class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.accounts'
     verbose_name = 'User Accounts'
+    
+    def ready(self):
+        """Connect signal handlers and apply the Argon2 cost parameters from settings."""
+        from django.contrib.auth.hashers import Argon2PasswordHasher
+        from . import signals  # noqa: F401
+        
+        Argon2PasswordHasher.time_cost = getattr(
+            settings, 'ARGON2_TIME_COST', Argon2PasswordHasher.time_cost
+        )
+        Argon2PasswordHasher.memory_cost = getattr(
+            settings, 'ARGON2_MEMORY_COST', Argon2PasswordHasher.memory_cost
+        )
+        Argon2PasswordHasher.parallelism = getattr(
+            settings, 'ARGON2_PARALLELISM', Argon2PasswordHasher.parallelism
+        )
@@ -0,0 +1,330 @@
+"""
+Authentication for Accounts App
+
+This module contains JWT authentication that rejects access tokens revoked at
+logout. Revoked token IDs (JTIs) are kept in the Django cache, which is shared
+between workers when a shared backend is configured, and mirrored in a
+bounded per-process map so repeat checks for a revoked token stay local.
+
+Successful authentications are also cached per process for a few seconds,
+so a client sending several requests in a row with the same token is only
+verified and looked up once.
+
+Refresh token rotation revokes the old refresh token in the cache at once and
+writes the blacklist rows in the background after the response.
+"""
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.background import submit_on_commit
+
+
+# Cache key prefix for revoked JTIs
+REVOKED_JTI_KEY_PREFIX = 'accounts:revoked-jti:'
+
+# Least recently revoked entries are dropped past this many JTIs; dropped
+# entries are still found in the Django cache
+LOCAL_REVOCATIONS_MAX_SIZE = 10000
+
+# Authenticated tokens are reused for at most this many seconds
+AUTH_CACHE_TTL = 5
+
+# Least recently used entries are dropped past this many tokens
+AUTH_CACHE_MAX_SIZE = 10000
+
+
+class _LocalRevocations:
+    """
+    Local Revocations
+    
+    Thread-safe, size-bounded mirror of revoked JTIs and their token expiry
+    (unix timestamp). The oldest revocations are evicted first; an evicted
+    JTI is looked up in the Django cache again on its next use.
+    """
+    
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def add(self, jti, exp):
+        """
+        Record a revoked JTI until its token expires.
+        """
+        with self._lock:
+            self._entries[jti] = exp
+            self._entries.move_to_end(jti)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def __contains__(self, jti):
+        with self._lock:
+            exp = self._entries.get(jti)
+            if exp is None:
+                return False
+            if exp <= time.time():
+                del self._entries[jti]
+                return False
+            return True
+    
+    def clear(self):
+        """
+        Drop all recorded revocations.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+# Revocations seen by this process
+_local_revocations = _LocalRevocations(LOCAL_REVOCATIONS_MAX_SIZE)
+
+
+def revoke_tokens(*tokens):
+    """
+    Revoke tokens until they expire.
+    
+    All JTIs are written with a single set_many call, which the Redis cache
+    backend sends as one pipelined round trip.
+    
+    Args:
+        *tokens (Token): Validated simplejwt tokens (access or refresh)
+    """
+    now = time.time()
+    
+    # Group by timeout: each entry lives until its token would expire anyway
+    entries_by_timeout = {}
+    for token in tokens:
+        jti = token[api_settings.JTI_CLAIM]
+        exp = token['exp']
+        timeout = max(int(exp - now), 0) + 1
+        entries_by_timeout.setdefault(timeout, {})[REVOKED_JTI_KEY_PREFIX + jti] = True
+        _local_revocations.add(jti, exp)
+    
+    for timeout, entries in entries_by_timeout.items():
+        cache.set_many(entries, timeout=timeout)
+
+
+def is_token_revoked(token):
+    """
+    Check whether a token has been revoked.
+    
+    Args:
+        token (Token): Validated simplejwt token
+    
+    Returns:
+        bool: True if the token was revoked at logout
+    """
+    jti = token.get(api_settings.JTI_CLAIM)
+    if jti is None:
+        return False
+    
+    if jti in _local_revocations:
+        return True
+    
+    if cache.get(REVOKED_JTI_KEY_PREFIX + jti):
+        _local_revocations.add(jti, token['exp'])
+        return True
+    
+    return False
+
+
+class RevocationAwareJWTAuthentication(JWTAuthentication):
+    """
+    Revocation Aware JWT Authentication
+    
+    Standard simplejwt authentication that also rejects revoked access tokens.
+    """
+    
+    def get_validated_token(self, raw_token):
+        """
+        Validate the token and reject it if it has been revoked.
+        """
+        token = super().get_validated_token(raw_token)
+        
+        if is_token_revoked(token):
+            raise InvalidToken('Token has been revoked')
+        
+        return token
+
+
+class _AuthenticationCache:
+    """
+    Authentication Cache
+    
+    Thread-safe LRU mapping of token hashes to (user, validated token), with
+    a per-entry expiry. Raw tokens are never stored, only their SHA-256.
+    """
+    
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """
+        Return the cached (user, token) pair, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key, value, ttl):
+        """
+        Cache a (user, token) pair for ttl seconds.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def forget_user(self, user_id):
+        """
+        Drop every cached authentication of a user.
+        """
+        with self._lock:
+            stale_keys = [
+                key for key, (_, (user, _token)) in self._entries.items()
+                if user.pk == user_id
+            ]
+            for key in stale_keys:
+                del self._entries[key]
+    
+    def clear(self):
+        """
+        Drop all cached authentications.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+# Authentications cached by this process
+authentication_cache = _AuthenticationCache(AUTH_CACHE_MAX_SIZE)
+
+
+class CachedJWTAuthentication(RevocationAwareJWTAuthentication):
+    """
+    Cached JWT Authentication
+    
+    Revocation aware JWT authentication that reuses the verified token and
+    user for AUTH_CACHE_TTL seconds (never past the token's expiry), skipping
+    signature verification and the user query on repeat requests.
+    Revocation is still checked on every request. Changes to a user saved in
+    this process drop their cached entries at once (see signals.py); other
+    processes pick them up within AUTH_CACHE_TTL seconds.
+    """
+    
+    def authenticate(self, request):
+        """
+        Authenticate from the cache, or verify the token and cache the result.
+        """
+        header = self.get_header(request)
+        if header is None:
+            return None
+        
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        
+        key = hashlib.sha256(raw_token).digest()
+        cached = authentication_cache.get(key)
+        if cached is not None:
+            user, token = cached
+            if is_token_revoked(token):
+                raise InvalidToken('Token has been revoked')
+            # Each request gets its own copy to modify
+            return copy.copy(user), token
+        
+        token = self.get_validated_token(raw_token)
+        user = self.get_user(token)
+        
+        ttl = min(AUTH_CACHE_TTL, token['exp'] - time.time())
+        if ttl > 0:
+            authentication_cache.set(key, (copy.copy(user), token), ttl)
+        
+        return user, token
+
+
+def _blacklist_refresh_token(raw_token):
+    """
+    Write the outstanding and blacklisted token rows for a refresh token.
+    """
+    RefreshToken(raw_token, verify=False).blacklist()
+
+
+def _outstand_refresh_token(raw_token):
+    """
+    Write the outstanding token row for a refresh token.
+    """
+    RefreshToken(raw_token, verify=False).outstand()
+
+
+class DeferredBlacklistRefreshToken(RefreshToken):
+    """
+    Deferred Blacklist Refresh Token
+    
+    Refresh token whose blacklist and outstanding token writes run in the
+    background once the current transaction commits. Blacklisting revokes
+    the token in the revocation cache first, so it is rejected immediately.
+    """
+    
+    def blacklist(self):
+        """
+        Revoke the token now and queue the blacklist rows.
+        """
+        revoke_tokens(self)
+        # Encoded now: the refresh serializer rotates this token's claims next
+        submit_on_commit(_blacklist_refresh_token, str(self))
+    
+    def outstand(self):
+        """
+        Queue the outstanding token row.
+        """
+        submit_on_commit(_outstand_refresh_token, str(self))
+
+
+class RevocationAwareTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Revocation Aware Token Refresh Serializer
+    
+    Rejects refresh tokens revoked at logout or rotation from the revocation
+    cache, before the database blacklist lookup done by the standard
+    serializer. Rotation writes to the token blacklist tables are deferred
+    (see DeferredBlacklistRefreshToken).
+    """
+    
+    token_class = DeferredBlacklistRefreshToken
+    
+    def validate(self, attrs):
+        """
+        Reject revoked refresh tokens, then refresh as usual.
+        """
+        try:
+            # Signature and expiry are verified by super().validate();
+            # the unverified payload is only used to reject early
+            token = self.token_class(attrs['refresh'], verify=False)
+        except TokenError:
+            token = None
+        
+        if token is not None and is_token_revoked(token):
+            raise TokenError('Token is blacklisted')
+        
+        return super().validate(attrs)
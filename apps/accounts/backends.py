@@ -0,0 +1,72 @@
+"""
+Authentication Backends for Accounts App
+
+This module contains a ModelBackend variant that only loads the user
+columns needed on the authentication path instead of the full row.
+"""
+
+from django.contrib.auth.backends import ModelBackend
+from .models import User
+
+
+# Columns needed to verify a login and render the login response
+LOGIN_FIELDS = (
+    'id',
+    'password',
+    'is_active',
+    'user_type',
+    'email',
+    'name',
+    'phone',
+    'badge_number',
+    'fire_station',
+    'created_at',
+)
+
+# Session users (Django admin) additionally need the permission flags
+SESSION_FIELDS = LOGIN_FIELDS + (
+    'is_staff',
+    'is_superuser',
+    'first_name',
+)
+
+
+class LeanModelBackend(ModelBackend):
+    """
+    Lean Model Backend
+    
+    Same behaviour as Django's ModelBackend, but fetches users with
+    .only() so unused AbstractUser columns are not loaded on every login.
+    """
+    
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        """
+        Authenticate a user by email and password.
+        """
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        
+        user = User.objects.only(*LOGIN_FIELDS).filter(
+            **{User.USERNAME_FIELD: username}
+        ).first()
+        
+        if user is None:
+            # Run the password hasher once to reduce the timing difference
+            # between an existing and a nonexistent user, as ModelBackend does.
+            User().set_password(password)
+            return None
+        
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
+    
+    def get_user(self, user_id):
+        """
+        Retrieve the user for a session.
+        """
+        user = User.objects.only(*SESSION_FIELDS).filter(pk=user_id).first()
+        if user is None:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,40 @@
+# Trigram indexes backing the admin changelist search on PostgreSQL.
+
+from django.db import migrations
+
+
+# Django's icontains lookup on PostgreSQL compiles to
+# UPPER("column"::text) LIKE UPPER(%s), so the indexes use the same expression.
+TRIGRAM_INDEXES = [
+    ('accounts_user_email_trgm', 'email'),
+    ('accounts_user_badge_number_trgm', 'badge_number'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON accounts_user '
+            f'USING gin ((UPPER({column}::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
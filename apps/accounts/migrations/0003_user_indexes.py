@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_trigram_search_indexes'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True, help_text='When the user account was created'),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='user_type',
+            field=models.CharField(choices=[('public', 'Public User'), ('fire_team', 'Fire Team Member'), ('admin', 'Administrator')], db_index=True, default='public', help_text='Type of user account', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['user_type', '-created_at'], name='accounts_us_user_ty_6d33dc_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:19
+
+import uuid6
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='id',
+            field=models.UUIDField(default=uuid6.uuid7, editable=False, help_text='Unique identifier for the user', primary_key=True, serialize=False),
+        ),
+    ]
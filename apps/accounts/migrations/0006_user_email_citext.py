@@ -0,0 +1,67 @@
+# Case-insensitive email column on PostgreSQL.
+
+from django.db import migrations
+
+from apps.accounts.models import CaseInsensitiveEmailField
+
+
+# With citext, the plain equality lookups used at login compare emails
+# case-insensitively and are served by the existing unique btree index,
+# so no LOWER() expression or functional index is needed. citext is used
+# rather than a nondeterministic ICU collation because the admin search
+# (icontains -> LIKE) does not work on nondeterministic collations.
+
+
+def _email_like_indexes(cursor):
+    # Django adds a varchar_pattern_ops index next to the unique index;
+    # that operator class cannot be used with citext.
+    cursor.execute(
+        "SELECT indexname FROM pg_indexes "
+        "WHERE tablename = 'accounts_user' AND indexname LIKE 'accounts_user_email_%_like'"
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def email_to_citext(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS citext')
+    with schema_editor.connection.cursor() as cursor:
+        like_indexes = _email_like_indexes(cursor)
+    for name in like_indexes:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+    schema_editor.execute('ALTER TABLE accounts_user ALTER COLUMN email TYPE citext')
+
+
+def email_to_varchar(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('ALTER TABLE accounts_user ALTER COLUMN email TYPE varchar(254)')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS accounts_user_email_like '
+        'ON accounts_user (email varchar_pattern_ops)'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_remove_user_ordering'),
+    ]
+
+    operations = [
+        # The column is converted by hand (the extension and the _like index
+        # need handling); the state records the field that describes it
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(email_to_citext, email_to_varchar),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='user',
+                    name='email',
+                    field=CaseInsensitiveEmailField(help_text='Email address (used for login)', max_length=254, unique=True),
+                ),
+            ],
+        ),
+    ]
@@ -6,11 +6,25 @@ It includes fields specific to the Fire Watcher application such as user type,
 badge number for fire team members, and fire station assignment.
 """
 
-import uuid
+import uuid6
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 
 
+class CaseInsensitiveEmailField(models.EmailField):
+    """
+    Email field stored as citext on PostgreSQL.
+    
+    Equality lookups on citext compare case-insensitively and use the plain
+    unique index. Other databases store a regular varchar column.
+    """
+    
+    def db_type(self, connection):
+        if connection.vendor == 'postgresql':
+            return 'citext'
+        return super().db_type(connection)
+
+
 class User(AbstractUser):
     """
     Custom User Model
@@ -23,16 +37,22 @@ class User(AbstractUser):
     """
     
     # User Type Choices
-    USER_TYPE_CHOICES = [
-        ('public', 'Public User'),
-        ('fire_team', 'Fire Team Member'),
-        ('admin', 'Administrator'),
-    ]
+    class UserType(models.TextChoices):
+        PUBLIC = 'public', 'Public User'
+        FIRE_TEAM = 'fire_team', 'Fire Team Member'
+        ADMIN = 'admin', 'Administrator'
+    
+    USER_TYPE_CHOICES = UserType.choices
+    
+    # User types that see and manage all incidents
+    RESPONDER_TYPES = frozenset({UserType.FIRE_TEAM, UserType.ADMIN})
     
     # Primary Key - using UUID for better security
+    # UUIDv7 is time-ordered, so new rows append to the right edge of the
+    # primary key index instead of landing on random pages.
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid6.uuid7,
         editable=False,
         help_text="Unique identifier for the user"
     )
@@ -43,7 +63,7 @@ class User(AbstractUser):
         help_text="Full name of the user"
     )
     
-    email = models.EmailField(
+    email = CaseInsensitiveEmailField(
         unique=True,
         help_text="Email address (used for login)"
     )
@@ -59,7 +79,8 @@ class User(AbstractUser):
     user_type = models.CharField(
         max_length=20,
         choices=USER_TYPE_CHOICES,
-        default='public',
+        default=UserType.PUBLIC,
+        db_index=True,
         help_text="Type of user account"
     )
     
@@ -81,6 +102,7 @@ class User(AbstractUser):
     # Timestamps
     created_at = models.DateTimeField(
         auto_now_add=True,
+        db_index=True,
         help_text="When the user account was created"
     )
     
@@ -91,16 +113,31 @@ class User(AbstractUser):
     class Meta:
         verbose_name = 'User'
         verbose_name_plural = 'Users'
-        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user_type', '-created_at']),
+        ]
     
     def __str__(self):
         """String representation of the user."""
         return f"{self.name} ({self.email})"
     
+    @property
+    def role(self):
+        """User type as a UserType member, or None for an unknown code."""
+        try:
+            return self.UserType(self.user_type)
+        except ValueError:
+            return None
+    
     def is_fire_team(self):
         """Check if user is a fire team member."""
-        return self.user_type == 'fire_team'
+        return self.user_type == self.UserType.FIRE_TEAM
     
     def is_admin_user(self):
         """Check if user is an administrator."""
-        return self.user_type == 'admin'
+        return self.user_type == self.UserType.ADMIN
+    
+    @property
+    def is_responder(self):
+        """Check if user sees all incidents (fire team or admin)."""
+        return self.user_type in self.RESPONDER_TYPES
@@ -6,17 +6,126 @@ Serializers handle the conversion between complex data types (like Django models
 and Python datatypes that can be easily rendered into JSON.
 """
 
+import copy
+from operator import attrgetter
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import EmailValidator
+from django.db import models
 from rest_framework import serializers
 from django.contrib.auth.password_validation import validate_password
 from .models import User
 
 
+# Django's email validator; its user and domain regexes are compiled once
+# at class definition, so calling it costs no regex compilation
+_email_validator = EmailValidator()
+
+# Valid user_type codes, built once instead of per validation call
+_VALID_USER_TYPES = frozenset(code for code, _ in User.USER_TYPE_CHOICES)
+
+# Output formatting for created_at, identical to what ModelSerializer builds
+_created_at_field = serializers.DateTimeField(read_only=True)
+
+# (field name, getter) pairs for UserSerializer's read path, built once at import.
+# Must list the same fields, in the same order, as UserSerializer.Meta.fields.
+_USER_FIELD_GETTERS = (
+    ('id', lambda user: str(user.id)),
+    ('email', attrgetter('email')),
+    ('name', attrgetter('name')),
+    ('phone', attrgetter('phone')),
+    ('user_type', attrgetter('user_type')),
+    ('badge_number', attrgetter('badge_number')),
+    ('fire_station', attrgetter('fire_station')),
+    ('created_at', lambda user: _created_at_field.to_representation(user.created_at)),
+)
+
+
+def user_to_representation(user):
+    """
+    Serialize a user to the UserSerializer output without a serializer instance.
+    
+    Args:
+        user (User): User to serialize
+    
+    Returns:
+        dict: The same data UserSerializer(user).data would return
+    """
+    return {name: getter(user) for name, getter in _USER_FIELD_GETTERS}
+
+
+def _copy_field(field):
+    """
+    Copy a cached serializer field for use by a new serializer instance.
+    
+    Plain fields are shallow-copied, which is much cheaper than deepcopy and
+    enough because binding only sets attributes on the copy. Nested
+    serializers and fields with a child (e.g. ListField) are deep-copied,
+    since their children are bound to the parent they were built with.
+    """
+    if isinstance(field, serializers.BaseSerializer) or hasattr(field, 'child'):
+        return copy.deepcopy(field)
+    return copy.copy(field)
+
+
+class FastEmailField(serializers.EmailField):
+    """
+    Email field that validates the address before running its validators.
+    
+    ModelSerializer passes UniqueValidator in the field's validators, and
+    EmailField appends its EmailValidator after it, so the uniqueness query
+    would run first. The address is checked with EmailValidator in
+    to_internal_value instead, so malformed addresses fail without touching
+    the database, and the EmailValidator is dropped from the validator list.
+    """
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.validators = [
+            validator for validator in self.validators
+            if not isinstance(validator, EmailValidator)
+        ]
+    
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        try:
+            _email_validator(value)
+        except DjangoValidationError:
+            self.fail('invalid')
+        return value
+
+
+class CachedFieldsMixin:
+    """
+    Cached Fields Mixin
+    
+    ModelSerializer.get_fields() introspects the model on every instantiation.
+    The result depends only on the serializer class, so this mixin builds it
+    once per class on first use and hands each instance copies of the fields.
+    """
+    
+    def get_fields(self):
+        """
+        Return copies of the class-level cached fields.
+        """
+        serializer_class = type(self)
+        # Look in the class's own __dict__ so subclasses build their own cache
+        cached_fields = serializer_class.__dict__.get('_cached_fields')
+        if cached_fields is None:
+            cached_fields = super().get_fields()
+            serializer_class._cached_fields = cached_fields
+        return {name: _copy_field(field) for name, field in cached_fields.items()}
+
+
 class UserSerializer(serializers.ModelSerializer):
     """
     User Serializer
     
     Serializes user data for API responses.
     Excludes sensitive information like password.
+    
+    Reads skip DRF's field binding and use the precomputed getters in
+    _USER_FIELD_GETTERS; writes go through the regular ModelSerializer path.
     """
     
     class Meta:
@@ -32,9 +141,15 @@ class UserSerializer(serializers.ModelSerializer):
             'created_at',
         ]
         read_only_fields = ['id', 'created_at']
+    
+    def to_representation(self, instance):
+        """
+        Serialize a user without building the serializer field tree.
+        """
+        return user_to_representation(instance)
 
 
-class UserRegistrationSerializer(serializers.ModelSerializer):
+class UserRegistrationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     User Registration Serializer
     
@@ -57,6 +172,12 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         help_text="Password confirmation"
     )
     
+    # Build the model's email field as a FastEmailField
+    serializer_field_mapping = {
+        **serializers.ModelSerializer.serializer_field_mapping,
+        models.EmailField: FastEmailField,
+    }
+    
     class Meta:
         model = User
         fields = [
@@ -86,7 +207,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         Only allow 'public' type during self-registration.
         Fire team and admin accounts should be created by admins.
         """
-        if value not in ['public', 'fire_team', 'admin']:
+        if value not in _VALID_USER_TYPES:
             raise serializers.ValidationError("Invalid user type.")
         return value
     
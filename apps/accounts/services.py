@@ -6,10 +6,18 @@ Following clean architecture principles, services encapsulate business rules
 and keep views thin and focused on HTTP concerns.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
 from django.db import transaction
 from .models import User
-from .serializers import UserRegistrationSerializer, UserSerializer
+from .serializers import (
+    UserRegistrationSerializer,
+    UserSerializer,
+    user_to_representation
+)
 
 
 class UserService:
@@ -44,13 +52,48 @@ class UserService:
         serializer = UserRegistrationSerializer(data=data)
         
         if serializer.is_valid():
-            # Use transaction to ensure data integrity
-            with transaction.atomic():
-                user = serializer.save()
+            # A single INSERT; callers compose atomic() if they need more
+            user = serializer.save()
             return user, None
         else:
             return None, serializer.errors
     
+    @staticmethod
+    def bulk_register(rows, batch_size=500):
+        """
+        Register many users at once (e.g. a CSV import of fire team members).
+        
+        Passwords are hashed in a thread pool: argon2-cffi releases the GIL
+        while hashing, so threads use every core without forking processes.
+        All users are then inserted with bulk_create in a single transaction.
+        
+        Args:
+            rows (list): Dicts of User fields, each including a plain 'password'
+            batch_size (int, optional): Rows per INSERT statement
+        
+        Returns:
+            list: Created user instances
+        
+        Example:
+            users = UserService.bulk_register([
+                {'email': 'ft1@example.com', 'name': 'Team One',
+                 'password': 'securepass123', 'user_type': 'fire_team'},
+            ])
+        """
+        rows = [dict(row) for row in rows]
+        passwords = [row.pop('password') for row in rows]
+        
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            hashed_passwords = list(executor.map(make_password, passwords))
+        
+        users = []
+        for row, hashed_password in zip(rows, hashed_passwords):
+            row.setdefault('username', row['email'])
+            users.append(User(password=hashed_password, **row))
+        
+        with transaction.atomic():
+            return User.objects.bulk_create(users, batch_size=batch_size)
+    
     @staticmethod
     def authenticate_user(email, password):
         """
@@ -80,10 +123,7 @@ class UserService:
         Returns:
             User or None: User instance if found, None otherwise
         """
-        try:
-            return User.objects.get(id=user_id)
-        except User.DoesNotExist:
-            return None
+        return User.objects.filter(id=user_id).first()
     
     @staticmethod
     def get_user_by_email(email):
@@ -96,10 +136,7 @@ class UserService:
         Returns:
             User or None: User instance if found, None otherwise
         """
-        try:
-            return User.objects.get(email=email)
-        except User.DoesNotExist:
-            return None
+        return User.objects.filter(email=email).first()
     
     @staticmethod
     def update_user_profile(user, data):
@@ -118,12 +155,24 @@ class UserService:
         serializer = UserUpdateSerializer(user, data=data, partial=True)
         
         if serializer.is_valid():
-            with transaction.atomic():
-                user = serializer.save()
+            user = serializer.save()
             return user, None
         else:
             return None, serializer.errors
     
+    @staticmethod
+    def user_to_dict(user):
+        """
+        Build the API representation of a user for auth responses.
+        
+        Args:
+            user (User): User instance to represent
+        
+        Returns:
+            dict: Same keys and values as UserSerializer(user).data
+        """
+        return user_to_representation(user)
+    
     @staticmethod
     def get_fire_team_members():
         """
@@ -132,7 +181,26 @@ class UserService:
         Returns:
             QuerySet: All users with user_type='fire_team'
         """
-        return User.objects.filter(user_type='fire_team')
+        return User.objects.filter(user_type=User.UserType.FIRE_TEAM)
+    
+    @staticmethod
+    def serialize_fire_team_members():
+        """
+        Get all fire team members as JSON-ready dictionaries.
+        
+        Loads only the UserSerializer columns and formats each user with
+        user_to_representation, skipping per-field serializer work for
+        read-only listings.
+        
+        Returns:
+            list: One dict per fire team member, equal to UserSerializer(user).data
+        """
+        members = (
+            User.objects.filter(user_type=User.UserType.FIRE_TEAM)
+            .order_by('-created_at')
+            .only(*UserSerializer.Meta.fields)
+        )
+        return [user_to_representation(member) for member in members]
     
     @staticmethod
     def is_fire_team_member(user):
@@ -145,4 +213,4 @@ class UserService:
         Returns:
             bool: True if user is fire team member, False otherwise
         """
-        return user.user_type == 'fire_team' if user else False
+        return user.is_fire_team() if user else False
@@ -0,0 +1,20 @@
+"""
+Signal Handlers for Accounts App
+
+This module keeps cached authentication data in sync with the database.
+Handlers are connected in AccountsConfig.ready().
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .auth import authentication_cache
+from .models import User
+
+
+@receiver(post_save, sender=User, dispatch_uid='accounts_auth_cache_on_save')
+@receiver(post_delete, sender=User, dispatch_uid='accounts_auth_cache_on_delete')
+def forget_cached_authentications(sender, instance, **kwargs):
+    """
+    Drop cached authentications of a user when the user is saved or deleted.
+    """
+    authentication_cache.forget_user(instance.pk)
@@ -10,11 +10,20 @@ Tests cover:
 - Permission checks
 """
 
-from django.test import TestCase
+import time
+from types import SimpleNamespace
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
-from rest_framework import status
+from rest_framework import status, serializers
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from apps.accounts.auth import _LocalRevocations, authentication_cache
 from apps.accounts.models import User
+from apps.accounts.serializers import UserSerializer
+from apps.accounts.services import UserService
 
 
 class UserRegistrationTests(TestCase):
@@ -105,6 +114,39 @@ class UserRegistrationTests(TestCase):
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
     
+    def test_register_malformed_email_skips_database(self):
+        """Test a malformed email is rejected before the uniqueness query."""
+        data = {
+            'email': 'not-an-email',
+            'name': 'Test User',
+            'password': 'testpass123',
+            'password_confirm': 'testpass123',
+            'user_type': 'public'
+        }
+        
+        with self.assertNumQueries(0):
+            response = self.client.post(self.register_url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('email', response.data)
+    
+    def test_register_invalid_email_with_at_sign_skips_database(self):
+        """Test addresses EmailValidator rejects fail before the uniqueness query."""
+        for email in ('foo@bar', 'a@b..com'):
+            data = {
+                'email': email,
+                'name': 'Test User',
+                'password': 'testpass123',
+                'password_confirm': 'testpass123',
+                'user_type': 'public'
+            }
+            
+            with self.subTest(email=email), self.assertNumQueries(0):
+                response = self.client.post(self.register_url, data, format='json')
+                
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('email', response.data)
+    
     def test_register_missing_required_fields(self):
         """Test registration fails when required fields are missing."""
         data = {
@@ -120,13 +162,10 @@ class UserRegistrationTests(TestCase):
 class UserLoginTests(TestCase):
     """Test suite for user login."""
     
-    def setUp(self):
-        """Set up test client and create test user."""
-        self.client = APIClient()
-        self.login_url = reverse('login')
-        
-        # Create test user
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Create test user once for the whole class."""
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             name='Test User',
@@ -134,6 +173,11 @@ class UserLoginTests(TestCase):
             user_type='public'
         )
     
+    def setUp(self):
+        """Set up test client."""
+        self.client = APIClient()
+        self.login_url = reverse('login')
+    
     def test_login_success(self):
         """Test successful login with valid credentials."""
         data = {
@@ -183,13 +227,10 @@ class UserLoginTests(TestCase):
 class CurrentUserTests(TestCase):
     """Test suite for current user endpoint."""
     
-    def setUp(self):
-        """Set up test client and create authenticated user."""
-        self.client = APIClient()
-        self.me_url = reverse('current-user')
-        
-        # Create and authenticate user
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Create test user once for the whole class."""
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             name='Test User',
@@ -197,6 +238,11 @@ class CurrentUserTests(TestCase):
             phone='+1234567890',
             user_type='public'
         )
+    
+    def setUp(self):
+        """Set up test client and authenticate the user."""
+        self.client = APIClient()
+        self.me_url = reverse('current-user')
         self.client.force_authenticate(user=self.user)
     
     def test_get_current_user_success(self):
@@ -208,6 +254,15 @@ class CurrentUserTests(TestCase):
         self.assertEqual(response.data['name'], 'Test User')
         self.assertEqual(response.data['user_type'], 'public')
     
+    def test_user_serializer_matches_model_serializer(self):
+        """Test the UserSerializer read path matches ModelSerializer output."""
+        fast = UserSerializer(self.user).data
+        regular = serializers.ModelSerializer.to_representation(
+            UserSerializer(), self.user
+        )
+        
+        self.assertEqual(dict(fast), dict(regular))
+    
     def test_get_current_user_unauthenticated(self):
         """Test retrieving current user fails when not authenticated."""
         self.client.force_authenticate(user=None)
@@ -237,19 +292,21 @@ class CurrentUserTests(TestCase):
 class TokenRefreshTests(TestCase):
     """Test suite for JWT token refresh."""
     
-    def setUp(self):
-        """Set up test client and create user with tokens."""
-        self.client = APIClient()
-        self.refresh_url = reverse('token-refresh')
-        self.login_url = reverse('login')
-        
-        # Create user
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Create test user once for the whole class."""
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             name='Test User',
             password='testpass123'
         )
+    
+    def setUp(self):
+        """Set up test client and log in to get tokens."""
+        self.client = APIClient()
+        self.refresh_url = reverse('token-refresh')
+        self.login_url = reverse('login')
         
         # Login to get tokens
         login_data = {
@@ -270,6 +327,23 @@ class TokenRefreshTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('access', response.data)
     
+    def test_rotated_refresh_token_rejected_before_blacklist_write(self):
+        """Test rotation defers the blacklist write but rejects the old token at once."""
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(
+                self.refresh_url, {'refresh': self.refresh_token}, format='json'
+            )
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.data['refresh'], self.refresh_token)
+        self.assertEqual(len(callbacks), 2)
+        self.assertFalse(BlacklistedToken.objects.exists())
+        
+        response = self.client.post(
+            self.refresh_url, {'refresh': self.refresh_token}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    
     def test_refresh_token_invalid(self):
         """Test refresh fails with invalid token."""
         data = {
@@ -281,15 +355,145 @@ class TokenRefreshTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
-class UserPermissionsTests(TestCase):
-    """Test suite for user type permissions."""
+class LogoutTests(TestCase):
+    """Test suite for logout."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Create test user once for the whole class."""
+        cls.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            name='Test User',
+            password='testpass123'
+        )
     
     def setUp(self):
-        """Set up test users with different types."""
+        """Set up test client and log in to get tokens."""
         self.client = APIClient()
+        self.logout_url = reverse('logout')
+        self.me_url = reverse('current-user')
         
+        login_data = {
+            'email': 'test@example.com',
+            'password': 'testpass123'
+        }
+        login_response = self.client.post(reverse('login'), login_data, format='json')
+        self.tokens = login_response.data['tokens']
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.tokens['access']}")
+    
+    def test_logout_revokes_access_token(self):
+        """Test the access token is rejected after logout."""
+        response = self.client.post(
+            self.logout_url, {'refresh': self.tokens['refresh']}, format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_205_RESET_CONTENT)
+        self.assertEqual(
+            self.client.get(self.me_url).status_code,
+            status.HTTP_401_UNAUTHORIZED
+        )
+    
+    def test_logout_blacklists_refresh_token(self):
+        """Test the refresh token cannot be used after logout."""
+        self.client.post(self.logout_url, {'refresh': self.tokens['refresh']}, format='json')
+        
+        response = self.client.post(
+            reverse('token-refresh'), {'refresh': self.tokens['refresh']}, format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    
+    def test_revoked_refresh_token_rejected_from_cache(self):
+        """Test a refresh token revoked at logout is rejected without a DB lookup."""
+        self.client.post(self.logout_url, {'refresh': self.tokens['refresh']}, format='json')
+        
+        with self.assertNumQueries(0):
+            response = self.client.post(
+                reverse('token-refresh'), {'refresh': self.tokens['refresh']}, format='json'
+            )
+        
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    
+    def test_logout_missing_refresh_token(self):
+        """Test logout fails without a refresh token."""
+        response = self.client.post(self.logout_url, {}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.me_url).status_code, status.HTTP_200_OK)
+
+
+class LocalRevocationsTests(SimpleTestCase):
+    """Test suite for the per-process revocation mirror."""
+    
+    def test_oldest_revocations_evicted_past_max_size(self):
+        """Test the mirror never holds more than its maximum size."""
+        revocations = _LocalRevocations(max_size=2)
+        exp = time.time() + 60
+        for jti in ('a', 'b', 'c'):
+            revocations.add(jti, exp)
+        
+        self.assertNotIn('a', revocations)
+        self.assertIn('b', revocations)
+        self.assertIn('c', revocations)
+    
+    def test_expired_revocations_not_reported(self):
+        """Test revocations of expired tokens are dropped on lookup."""
+        revocations = _LocalRevocations(max_size=2)
+        revocations.add('old', time.time() - 1)
+        
+        self.assertNotIn('old', revocations)
+
+
+class AuthenticationCacheTests(TestCase):
+    """Test suite for cached JWT authentication."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Create test user once for the whole class."""
+        cls.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            name='Test User',
+            password='testpass123'
+        )
+    
+    def setUp(self):
+        """Set up test client with an access token."""
+        authentication_cache.clear()
+        self.client = APIClient()
+        self.me_url = reverse('current-user')
+        access = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+    
+    def test_repeat_request_skips_user_lookup(self):
+        """Test a second request with the same token does not query the user."""
+        self.client.get(self.me_url)
+        
+        with self.assertNumQueries(0):
+            response = self.client.get(self.me_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['email'], 'test@example.com')
+    
+    def test_profile_update_visible_on_next_request(self):
+        """Test a saved user change is not hidden by the cache."""
+        self.client.get(self.me_url)
+        
+        self.client.patch(self.me_url, {'name': 'Updated Name'}, format='json')
+        response = self.client.get(self.me_url)
+        
+        self.assertEqual(response.data['name'], 'Updated Name')
+
+
+class UserPermissionsTests(TestCase):
+    """Test suite for user type permissions."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test users with different types."""
         # Create public user
-        self.public_user = User.objects.create_user(
+        cls.public_user = User.objects.create_user(
             username='public',
             email='public@example.com',
             name='Public User',
@@ -298,7 +502,7 @@ class UserPermissionsTests(TestCase):
         )
         
         # Create fire team member
-        self.fire_team_user = User.objects.create_user(
+        cls.fire_team_user = User.objects.create_user(
             username='fireteam',
             email='fireteam@example.com',
             name='Fire Team',
@@ -309,7 +513,7 @@ class UserPermissionsTests(TestCase):
         )
         
         # Create admin
-        self.admin_user = User.objects.create_user(
+        cls.admin_user = User.objects.create_user(
             username='admin',
             email='admin@example.com',
             name='Admin User',
@@ -332,3 +536,67 @@ class UserPermissionsTests(TestCase):
         # Admin user
         self.assertFalse(self.admin_user.is_fire_team())
         self.assertTrue(self.admin_user.is_admin_user())
+    
+    def test_is_responder(self):
+        """Test only fire team members and admins are responders."""
+        self.assertFalse(self.public_user.is_responder)
+        self.assertTrue(self.fire_team_user.is_responder)
+        self.assertTrue(self.admin_user.is_responder)
+    
+    def test_email_column_type(self):
+        """Test the email column is citext on PostgreSQL and varchar elsewhere."""
+        field = User._meta.get_field('email')
+        postgresql = SimpleNamespace(vendor='postgresql')
+        
+        self.assertEqual(field.db_type(postgresql), 'citext')
+        self.assertEqual(field.db_type(connection), 'varchar(254)')
+    
+    def test_user_type_change_reflected_on_same_instance(self):
+        """Test role checks follow user_type changes and tolerate unknown codes."""
+        user = User(user_type='public')
+        self.assertFalse(user.is_responder)
+        
+        user.user_type = 'fire_team'
+        self.assertTrue(user.is_responder)
+        self.assertIs(user.role, User.UserType.FIRE_TEAM)
+        
+        user.user_type = 'retired'
+        self.assertIsNone(user.role)
+        self.assertFalse(user.is_responder)
+    
+    def test_serialize_fire_team_members(self):
+        """Test fire team listing only includes fire team members."""
+        members = UserService.serialize_fire_team_members()
+        
+        self.assertEqual(len(members), 1)
+        self.assertEqual(members[0], UserSerializer(self.fire_team_user).data)
+        self.assertEqual(members[0]['badge_number'], 'FT001')
+        self.assertNotIn('password', members[0])
+
+
+class BulkRegistrationTests(TestCase):
+    """Test suite for bulk user registration."""
+    
+    def test_bulk_register_creates_users(self):
+        """Test bulk registration creates users with usable passwords."""
+        users = UserService.bulk_register([
+            {
+                'email': 'ft1@example.com',
+                'name': 'Fire Team One',
+                'password': 'testpass123',
+                'user_type': 'fire_team'
+            },
+            {
+                'email': 'ft2@example.com',
+                'name': 'Fire Team Two',
+                'password': 'otherpass456',
+                'user_type': 'fire_team'
+            },
+        ])
+        
+        self.assertEqual(len(users), 2)
+        self.assertEqual(User.objects.filter(user_type='fire_team').count(), 2)
+        
+        user = User.objects.get(email='ft2@example.com')
+        self.assertEqual(user.username, 'ft2@example.com')
+        self.assertTrue(user.check_password('otherpass456'))
@@ -5,17 +5,12 @@ This module contains DRF views for authentication and user management.
 Views handle HTTP requests/responses and delegate business logic to services.
 """
 
-from rest_framework import status, generics
+from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
-from .models import User
-from .serializers import (
-    UserSerializer,
-    UserRegistrationSerializer,
-    UserUpdateSerializer
-)
+from .auth import revoke_tokens
 from .services import UserService
 
 
@@ -58,7 +53,7 @@ class RegisterView(APIView):
         refresh = RefreshToken.for_user(user)
         
         return Response({
-            'user': UserSerializer(user).data,
+            'user': UserService.user_to_dict(user),
             'tokens': {
                 'refresh': str(refresh),
                 'access': str(refresh.access_token),
@@ -120,7 +115,7 @@ class LoginView(APIView):
         refresh = RefreshToken.for_user(user)
         
         return Response({
-            'user': UserSerializer(user).data,
+            'user': UserService.user_to_dict(user),
             'tokens': {
                 'refresh': str(refresh),
                 'access': str(refresh.access_token),
@@ -148,8 +143,9 @@ class CurrentUserView(APIView):
             200: User data
             401: Not authenticated
         """
-        serializer = UserSerializer(request.user)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # request.user is already loaded by authentication, so serialize it
+        # directly rather than instantiating a serializer or re-querying
+        return Response(UserService.user_to_dict(request.user), status=status.HTTP_200_OK)
     
     def patch(self, request):
         """
@@ -171,7 +167,7 @@ class CurrentUserView(APIView):
             return Response(errors, status=status.HTTP_400_BAD_REQUEST)
         
         return Response(
-            UserSerializer(user).data,
+            UserService.user_to_dict(user),
             status=status.HTTP_200_OK
         )
 
@@ -182,7 +178,8 @@ class LogoutView(APIView):
     
     POST /api/auth/logout/
     
-    Blacklists the refresh token to log out the user.
+    Blacklists the refresh token and revokes the access token used for the
+    request, so neither can be used again.
     Requires authentication.
     """
     
@@ -214,6 +211,12 @@ class LogoutView(APIView):
             token = RefreshToken(refresh_token)
             token.blacklist()
             
+            # Revoke both tokens in the cache in one round trip
+            if request.auth is not None:
+                revoke_tokens(request.auth, token)
+            else:
+                revoke_tokens(token)
+            
             return Response(
                 {'message': 'Logout successful'},
                 status=status.HTTP_205_RESET_CONTENT
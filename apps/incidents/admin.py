@@ -26,8 +26,8 @@ class IncidentPhotoInline(admin.TabularInline):
     """
     model = IncidentPhoto
     extra = 0
-    readonly_fields = ['uploaded_at']
-    fields = ['image', 'uploaded_at']
+    readonly_fields = ['thumbnail', 'uploaded_at']
+    fields = ['image', 'thumbnail', 'uploaded_at']
 
 
 @admin.register(Incident)
@@ -97,6 +97,9 @@ class StatusUpdateAdmin(admin.ModelAdmin):
         'timestamp'
     ]
     
+    # Join the displayed foreign keys instead of querying them per row
+    list_select_related = ['incident', 'updated_by']
+    
     list_filter = [
         'status',
         'timestamp'
@@ -124,6 +127,9 @@ class IncidentPhotoAdmin(admin.ModelAdmin):
         'uploaded_at'
     ]
     
+    # Join the displayed incident instead of querying it per row
+    list_select_related = ['incident']
+    
     list_filter = [
         'uploaded_at'
     ]
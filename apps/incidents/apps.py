@@ -12,3 +12,7 @@ class IncidentsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.incidents'
     verbose_name = 'Fire Incidents'
+    
+    def ready(self):
+        """Connect signal handlers."""
+        from . import signals  # noqa: F401
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='incident',
+            name='lat',
+            field=models.FloatField(help_text='Latitude coordinate of the incident'),
+        ),
+        migrations.AlterField(
+            model_name='incident',
+            name='lng',
+            field=models.FloatField(help_text='Longitude coordinate of the incident'),
+        ),
+    ]
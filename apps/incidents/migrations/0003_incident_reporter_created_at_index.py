@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0002_incident_float_coordinates'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(fields=['reporter', '-created_at'], name='incidents_i_reporte_a0ccd7_idx'),
+        ),
+    ]
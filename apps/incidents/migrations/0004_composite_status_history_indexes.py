@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0003_incident_reporter_created_at_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(fields=['status', '-created_at'], name='incidents_i_status_3b7181_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='statusupdate',
+            index=models.Index(fields=['incident', '-timestamp'], name='incidents_s_inciden_d3aa88_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='incident',
+            name='incidents_i_status_9a4f12_idx',
+        ),
+    ]
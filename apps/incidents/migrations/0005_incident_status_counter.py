@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:36
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def seed_status_counters(apps, schema_editor):
+    Incident = apps.get_model('incidents', 'Incident')
+    IncidentStatusCounter = apps.get_model('incidents', 'IncidentStatusCounter')
+    counts = dict(
+        Incident.objects.order_by().values_list('status').annotate(count=Count('id'))
+    )
+    IncidentStatusCounter.objects.bulk_create([
+        IncidentStatusCounter(status=code, count=counts.get(code, 0))
+        for code, _ in Incident._meta.get_field('status').choices
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0004_composite_status_history_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IncidentStatusCounter',
+            fields=[
+                ('status', models.CharField(choices=[('new', 'New'), ('enroute', 'En Route'), ('arrived', 'Arrived'), ('fighting', 'Fighting Fire'), ('extinguished', 'Extinguished'), ('closed', 'Closed')], help_text='Incident status being counted', max_length=20, primary_key=True, serialize=False)),
+                ('count', models.BigIntegerField(default=0, help_text='Number of incidents currently in this status')),
+            ],
+            options={
+                'verbose_name': 'Incident Status Counter',
+                'verbose_name_plural': 'Incident Status Counters',
+            },
+        ),
+        migrations.RunPython(seed_status_counters, migrations.RunPython.noop),
+    ]
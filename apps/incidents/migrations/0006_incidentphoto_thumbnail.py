@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0005_incident_status_counter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentphoto',
+            name='thumbnail',
+            field=models.ImageField(blank=True, help_text='Downscaled copy of the photo, empty until generated', upload_to='incident_photos/thumbnails/%Y/%m/%d/'),
+        ),
+    ]
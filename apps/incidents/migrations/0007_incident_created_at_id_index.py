@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0006_incidentphoto_thumbnail'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(fields=['-created_at', '-id'], name='incidents_i_created_9ba426_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='incident',
+            name='incidents_i_created_c4c91a_idx',
+        ),
+    ]
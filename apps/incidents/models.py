@@ -6,13 +6,34 @@ Includes models for:
 - Incident: Core fire incident data
 - StatusUpdate: Audit trail for incident status changes
 - IncidentPhoto: Photos associated with incidents
+- IncidentStatusCounter: Denormalized incident counts per status
 """
 
 import uuid
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 
 
+def lock_stored_status(incident):
+    """
+    Lock an incident's row and return its stored status.
+    
+    Must run inside a transaction.
+    
+    Args:
+        incident (Incident): Incident whose row to lock
+    
+    Returns:
+        str or None: Stored status, or None if the row does not exist
+    """
+    return (
+        Incident.objects.select_for_update()
+        .filter(pk=incident.pk)
+        .values_list('status', flat=True)
+        .first()
+    )
+
+
 class Incident(models.Model):
     """
     Incident Model
@@ -63,15 +84,13 @@ class Incident(models.Model):
     )
     
     # Location Information
-    lat = models.DecimalField(
-        max_digits=9,
-        decimal_places=6,
+    # Stored as floats: double precision is accurate to well under a
+    # centimetre and serializes to JSON numbers without Decimal conversion
+    lat = models.FloatField(
         help_text="Latitude coordinate of the incident"
     )
     
-    lng = models.DecimalField(
-        max_digits=9,
-        decimal_places=6,
+    lng = models.FloatField(
         help_text="Longitude coordinate of the incident"
     )
     
@@ -108,10 +127,34 @@ class Incident(models.Model):
         verbose_name_plural = 'Incidents'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['-created_at']),
-            models.Index(fields=['status']),
+            # Newest-first feed; id breaks ties for cursor pagination
+            models.Index(fields=['-created_at', '-id']),
+            # Status filter with newest-first ordering; also serves status counts
+            models.Index(fields=['status', '-created_at']),
+            # Public users' "my incidents" list: filter by reporter, newest first
+            models.Index(fields=['reporter', '-created_at']),
         ]
     
+    def save(self, *args, **kwargs):
+        """
+        Save the incident.
+        
+        When status counters are maintained (DASHBOARD_STATS_USE_COUNTERS),
+        the stored row is locked and its status read first, so the post_save
+        handler moves the incident out of the status it really had, even if
+        another request changed it after this instance was loaded.
+        """
+        update_fields = kwargs.get('update_fields')
+        if (
+            not getattr(settings, 'DASHBOARD_STATS_USE_COUNTERS', False)
+            or (update_fields is not None and 'status' not in update_fields)
+        ):
+            return super().save(*args, **kwargs)
+        
+        with transaction.atomic(using=kwargs.get('using')):
+            self._stored_status = None if self._state.adding else lock_stored_status(self)
+            super().save(*args, **kwargs)
+    
     def __str__(self):
         """String representation of the incident."""
         return f"Incident {self.id} - {self.status} - {self.address}"
@@ -183,11 +226,13 @@ class StatusUpdate(models.Model):
         ordering = ['-timestamp']
         indexes = [
             models.Index(fields=['-timestamp']),
+            # An incident's history, newest first
+            models.Index(fields=['incident', '-timestamp']),
         ]
     
     def __str__(self):
         """String representation of the status update."""
-        return f"{self.incident.id} - {self.status} at {self.timestamp}"
+        return f"{self.incident_id} - {self.status} at {self.timestamp}"
 
 
 class IncidentPhoto(models.Model):
@@ -220,6 +265,13 @@ class IncidentPhoto(models.Model):
         help_text="Uploaded incident photo"
     )
     
+    # Thumbnail (generated in the background after upload)
+    thumbnail = models.ImageField(
+        upload_to='incident_photos/thumbnails/%Y/%m/%d/',
+        blank=True,
+        help_text="Downscaled copy of the photo, empty until generated"
+    )
+    
     # Timestamp
     uploaded_at = models.DateTimeField(
         auto_now_add=True,
@@ -233,4 +285,34 @@ class IncidentPhoto(models.Model):
     
     def __str__(self):
         """String representation of the photo."""
-        return f"Photo for {self.incident.id} - {self.uploaded_at}"
+        return f"Photo for {self.incident_id} - {self.uploaded_at}"
+
+
+class IncidentStatusCounter(models.Model):
+    """
+    Incident Status Counter Model
+    
+    Holds the number of incidents in each status, kept up to date as
+    incidents are created, change status, or are deleted. Lets the dashboard
+    read a handful of rows instead of counting the whole incidents table.
+    """
+    
+    status = models.CharField(
+        max_length=20,
+        choices=Incident.STATUS_CHOICES,
+        primary_key=True,
+        help_text="Incident status being counted"
+    )
+    
+    count = models.BigIntegerField(
+        default=0,
+        help_text="Number of incidents currently in this status"
+    )
+    
+    class Meta:
+        verbose_name = 'Incident Status Counter'
+        verbose_name_plural = 'Incident Status Counters'
+    
+    def __str__(self):
+        """String representation of the counter."""
+        return f"{self.status}: {self.count}"
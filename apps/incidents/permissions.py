@@ -29,12 +29,13 @@ class IsFireTeamOrReadOnly(permissions.BasePermission):
         Check if user has permission to access a specific incident.
         """
         # Fire team and admins can do anything
-        if request.user.is_fire_team() or request.user.is_admin_user():
+        if request.user.is_responder:
             return True
         
         # Public users can only view their own incidents
+        # (compare the FK column so the reporter row is never loaded)
         if request.method in permissions.SAFE_METHODS:
-            return obj.reporter == request.user
+            return obj.reporter_id == request.user.pk
         
         return False
 
@@ -51,5 +52,5 @@ class IsFireTeamOnly(permissions.BasePermission):
         return (
             request.user and
             request.user.is_authenticated and
-            (request.user.is_fire_team() or request.user.is_admin_user())
+            request.user.is_responder
         )
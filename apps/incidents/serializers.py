@@ -5,37 +5,45 @@ This module contains DRF serializers for incident-related data.
 Handles conversion between models and JSON for API responses.
 """
 
+from operator import attrgetter
+
 from rest_framework import serializers
 from .models import Incident, StatusUpdate, IncidentPhoto
-from apps.accounts.serializers import UserSerializer
+from apps.accounts.serializers import CachedFieldsMixin, UserSerializer
 
 
-class IncidentPhotoSerializer(serializers.ModelSerializer):
+class IncidentPhotoSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for incident photos.
     """
     
     class Meta:
         model = IncidentPhoto
-        fields = ['id', 'image', 'uploaded_at']
-        read_only_fields = ['id', 'uploaded_at']
+        fields = ['id', 'image', 'thumbnail', 'uploaded_at']
+        read_only_fields = ['id', 'thumbnail', 'uploaded_at']
 
 
-class StatusUpdateSerializer(serializers.ModelSerializer):
+class StatusUpdateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for status updates.
-    Includes information about who made the update.
+    Includes the ID and name of the user who made the update
+    (null if the update was anonymous or the user was deleted).
     """
     
-    updated_by = UserSerializer(read_only=True)
+    updated_by_id = serializers.UUIDField(read_only=True)
+    updated_by_name = serializers.CharField(
+        source='updated_by.name',
+        read_only=True,
+        allow_null=True
+    )
     
     class Meta:
         model = StatusUpdate
-        fields = ['id', 'status', 'updated_by', 'notes', 'timestamp']
+        fields = ['id', 'status', 'updated_by_id', 'updated_by_name', 'notes', 'timestamp']
         read_only_fields = ['id', 'timestamp']
 
 
-class IncidentListSerializer(serializers.ModelSerializer):
+class IncidentListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for incident list view.
     Includes basic information without nested relationships for performance.
@@ -56,17 +64,85 @@ class IncidentListSerializer(serializers.ModelSerializer):
             'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
+    
+    def to_representation(self, instance):
+        """
+        Serialize with getters specialized once for Meta.fields.
+        
+        Same output as ModelSerializer.to_representation, without walking
+        the bound fields for every incident.
+        """
+        return {name: getter(instance) for name, getter in _INCIDENT_LIST_GETTERS}
+
+
+# Output formatting for the non-JSON-native list columns, identical to
+# what ModelSerializer builds for them
+_timestamp_field = serializers.DateTimeField(read_only=True)
+
+_INCIDENT_ROW_COERCIONS = (
+    ('id', str),
+    ('created_at', _timestamp_field.to_representation),
+    ('updated_at', _timestamp_field.to_representation),
+)
+
+
+def _list_field_getter(name, coerce):
+    """
+    Build the getter for one IncidentListSerializer field.
+    """
+    get = attrgetter(name)
+    if coerce is None:
+        return get
+    return lambda incident: coerce(get(incident))
+
+
+# Instances may hold unsaved coordinates as Decimal or str; FloatField
+# output is always a float (values() rows already are)
+_INCIDENT_LIST_COERCIONS = {**dict(_INCIDENT_ROW_COERCIONS), 'lat': float, 'lng': float}
+
+# (field name, getter) pairs for IncidentListSerializer, built once at import
+_INCIDENT_LIST_GETTERS = tuple(
+    (name, _list_field_getter(name, _INCIDENT_LIST_COERCIONS.get(name)))
+    for name in IncidentListSerializer.Meta.fields
+)
 
 
-class IncidentDetailSerializer(serializers.ModelSerializer):
+def incident_row_to_representation(row):
+    """
+    Convert a values() row of incident list columns to IncidentListSerializer output.
+    
+    Args:
+        row (dict): Row from IncidentService.get_incidents_as_dicts
+    
+    Returns:
+        dict: A copy of the row with UUID and datetime values formatted; the
+        row itself is left as is, since cursor pagination reads it again
+    """
+    return {**row, **{name: coerce(row[name]) for name, coerce in _INCIDENT_ROW_COERCIONS}}
+
+
+class IncidentListRowSerializer(serializers.Serializer):
+    """
+    Serializer for incident list rows read with values().
+    Produces IncidentListSerializer output from dicts, without model
+    instances or per-field serializer calls (read-only).
+    """
+    
+    def to_representation(self, instance):
+        return incident_row_to_representation(instance)
+
+
+class IncidentDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for incident detail view.
-    Includes nested relationships for photos and status updates.
+    Includes nested relationships for photos and status updates, read from
+    the lists prefetched by IncidentService (get_incident_detail_queryset
+    or load_incident_detail) when present, and queried otherwise.
     """
     
     reporter = UserSerializer(read_only=True)
-    photos = IncidentPhotoSerializer(many=True, read_only=True)
-    status_updates = StatusUpdateSerializer(many=True, read_only=True)
+    photos = serializers.SerializerMethodField()
+    status_updates = serializers.SerializerMethodField()
     
     class Meta:
         model = Incident
@@ -86,9 +162,23 @@ class IncidentDetailSerializer(serializers.ModelSerializer):
             'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
+    
+    def get_photos(self, incident):
+        """Serialize the incident's photos, prefetched or not."""
+        photos = getattr(incident, 'photos_list', None)
+        if photos is None:
+            photos = incident.photos.all()
+        return IncidentPhotoSerializer(photos, many=True, context=self.context).data
+    
+    def get_status_updates(self, incident):
+        """Serialize the incident's status history, prefetched or not."""
+        status_updates = getattr(incident, 'status_updates_list', None)
+        if status_updates is None:
+            status_updates = incident.status_updates.select_related('updated_by')
+        return StatusUpdateSerializer(status_updates, many=True, context=self.context).data
 
 
-class IncidentCreateSerializer(serializers.ModelSerializer):
+class IncidentCreateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for creating new incidents.
     Handles photo uploads via multipart form data.
@@ -116,13 +206,13 @@ class IncidentCreateSerializer(serializers.ModelSerializer):
     
     def validate_lat(self, value):
         """Validate latitude is within valid range."""
-        if not -90 <= value <= 90:
+        if abs(value) > 90:
             raise serializers.ValidationError("Latitude must be between -90 and 90")
         return value
     
     def validate_lng(self, value):
         """Validate longitude is within valid range."""
-        if not -180 <= value <= 180:
+        if abs(value) > 180:
             raise serializers.ValidationError("Longitude must be between -180 and 180")
         return value
 
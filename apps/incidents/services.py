@@ -5,14 +5,66 @@ This module contains the business logic for incident-related operations.
 Following clean architecture principles, services encapsulate business rules.
 """
 
-from django.db import transaction
-from django.db.models import Count, Q
-from .models import Incident, StatusUpdate, IncidentPhoto
+import hashlib
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, F, Prefetch, Q, prefetch_related_objects
+from core.background import submit_on_commit
+from .models import Incident, IncidentStatusCounter, StatusUpdate, IncidentPhoto
 from .serializers import (
     IncidentCreateSerializer,
-    IncidentDetailSerializer,
     IncidentListSerializer
 )
+from .tasks import generate_thumbnails
+
+
+# Valid status codes, built once instead of per status update
+_VALID_STATUSES = frozenset(code for code, _ in Incident.STATUS_CHOICES)
+
+# Columns read by the list endpoint: exactly what IncidentListSerializer
+# outputs, so the list SELECT never carries reporter FKs or other unused columns
+INCIDENT_LIST_FIELDS = tuple(IncidentListSerializer.Meta.fields)
+
+# Dashboard buckets
+_ACTIVE_STATUSES = ('enroute', 'arrived', 'fighting')
+_RESOLVED_STATUSES = ('extinguished', 'closed')
+
+# Photo columns read by IncidentPhotoSerializer (plus the FK for the prefetch join)
+PHOTO_PREFETCH_FIELDS = ('id', 'incident_id', 'image', 'thumbnail', 'uploaded_at')
+
+# Dashboard stats are cached briefly and dropped whenever an incident changes
+DASHBOARD_STATS_CACHE_KEY = 'incidents:dashboard-stats:v1'
+DASHBOARD_STATS_CACHE_TIMEOUT = 30  # seconds
+
+# Rows per INSERT statement when attaching photos to an incident
+PHOTO_INSERT_BATCH_SIZE = 100
+
+# Maximum number of photos written to storage concurrently per request
+PHOTO_UPLOAD_WORKERS = 4
+
+
+def _store_photos(photos):
+    """
+    Save uploaded photos to storage in parallel.
+    
+    Args:
+        photos (list): Uploaded photo files
+    
+    Returns:
+        list: Stored file names, in the same order as photos
+    """
+    image_field = IncidentPhoto._meta.get_field('image')
+    
+    def store(photo):
+        name = image_field.generate_filename(None, photo.name)
+        return image_field.storage.save(name, photo, max_length=image_field.max_length)
+    
+    with ThreadPoolExecutor(max_workers=min(len(photos), PHOTO_UPLOAD_WORKERS)) as executor:
+        return list(executor.map(store, photos))
 
 
 class IncidentService:
@@ -52,39 +104,74 @@ class IncidentService:
         serializer = IncidentCreateSerializer(data=data)
         
         if serializer.is_valid():
-            with transaction.atomic():
-                # Create the incident
-                incident = Incident.objects.create(
-                    reporter=user,
-                    reporter_name=data.get('reporter_name', user.name if user else 'Anonymous'),
-                    reporter_phone=data.get('reporter_phone', user.phone if user else ''),
-                    lat=serializer.validated_data['lat'],
-                    lng=serializer.validated_data['lng'],
-                    address=serializer.validated_data['address'],
-                    description=serializer.validated_data['description'],
-                    status='new'
-                )
-                
-                # Create initial status update
-                StatusUpdate.objects.create(
-                    incident=incident,
-                    status='new',
-                    updated_by=user,
-                    notes='Incident reported'
+            # Write photo files before opening the transaction, so it is not
+            # held open while waiting on storage
+            photo_names = _store_photos(photos) if photos else []
+            
+            try:
+                incident = IncidentService._create_incident_records(
+                    serializer.validated_data, data, user, photo_names
                 )
-                
-                # Handle photo uploads
-                if photos:
-                    for photo in photos:
-                        IncidentPhoto.objects.create(
-                            incident=incident,
-                            image=photo
-                        )
+            except Exception:
+                # Nothing references the stored files if the insert failed
+                image_storage = IncidentPhoto._meta.get_field('image').storage
+                for name in photo_names:
+                    image_storage.delete(name)
+                raise
             
             return incident, None
         else:
             return None, serializer.errors
     
+    @staticmethod
+    def _create_incident_records(validated_data, data, user, photo_names):
+        """
+        Insert an incident with its initial status update and photo rows.
+        
+        Args:
+            validated_data (dict): Validated IncidentCreateSerializer data
+            data (dict): Raw request data (reporter name and phone)
+            user (User): User reporting the incident, or None
+            photo_names (list): Names of photo files already in storage
+        
+        Returns:
+            Incident: Created incident
+        """
+        with transaction.atomic():
+            # Create the incident
+            incident = Incident.objects.create(
+                reporter=user,
+                reporter_name=data.get('reporter_name', user.name if user else 'Anonymous'),
+                reporter_phone=data.get('reporter_phone', user.phone if user else ''),
+                lat=validated_data['lat'],
+                lng=validated_data['lng'],
+                address=validated_data['address'],
+                description=validated_data['description'],
+                status='new'
+            )
+            
+            # Create initial status update
+            StatusUpdate.objects.create(
+                incident=incident,
+                status='new',
+                updated_by=user,
+                notes='Incident reported'
+            )
+            
+            # Attach the stored photos with one multi-row INSERT
+            if photo_names:
+                IncidentPhoto.objects.bulk_create(
+                    [
+                        IncidentPhoto(incident=incident, image=name)
+                        for name in photo_names
+                    ],
+                    batch_size=PHOTO_INSERT_BATCH_SIZE
+                )
+                # Thumbnails are not needed for the response
+                submit_on_commit(generate_thumbnails, incident.id)
+        
+        return incident
+    
     @staticmethod
     def update_incident_status(incident, status, user, notes=''):
         """
@@ -100,14 +187,33 @@ class IncidentService:
             tuple: (updated incident, errors dict or None)
         """
         # Validate status
-        valid_statuses = [choice[0] for choice in Incident.STATUS_CHOICES]
-        if status not in valid_statuses:
+        if status not in _VALID_STATUSES:
+            valid_statuses = [choice[0] for choice in Incident.STATUS_CHOICES]
             return None, {'status': f'Invalid status. Must be one of: {valid_statuses}'}
         
+        # PostgreSQL: update and insert in a single round trip
+        if connection.vendor == 'postgresql':
+            with transaction.atomic():
+                result = IncidentService._update_status_in_one_statement(
+                    incident, status, user, notes
+                )
+                if result is None:
+                    return None, {'error': 'Incident not found'}
+                updated_at, old_status = result
+                
+                # The raw statement does not send post_save
+                if IncidentService.status_counters_enabled():
+                    IncidentService.shift_status_counters(old_status, status)
+                transaction.on_commit(IncidentService.invalidate_dashboard_stats)
+            
+            incident.status = status
+            incident.updated_at = updated_at
+            return incident, None
+        
         with transaction.atomic():
             # Update incident status
             incident.status = status
-            incident.save()
+            incident.save(update_fields=['status', 'updated_at'])
             
             # Create status update record
             StatusUpdate.objects.create(
@@ -120,9 +226,63 @@ class IncidentService:
         return incident, None
     
     @staticmethod
-    def get_incidents(filters=None, user=None):
+    def _update_status_in_one_statement(incident, status, user, notes):
         """
-        Get incidents with optional filtering.
+        Update an incident's status and record the change in one SQL statement.
+        
+        PostgreSQL only: a data-modifying CTE locks the row and reads its
+        current status, runs the UPDATE, and the INSERT of the StatusUpdate
+        row only happens if the incident still exists. Both use now(), so
+        updated_at and the update's timestamp are equal. The previous status
+        comes from the locked row, not from the possibly stale instance.
+        
+        Args:
+            incident (Incident): Incident to update
+            status (str): New status (already validated)
+            user (User): User making the update
+            notes (str): Notes about the status change
+        
+        Returns:
+            tuple or None: (new updated_at, previous status), or None if the
+            incident is gone
+        """
+        quote_name = connection.ops.quote_name
+        incident_table = quote_name(Incident._meta.db_table)
+        sql = (
+            f'WITH prev AS ('
+            f'SELECT "id", "status" FROM {incident_table} WHERE "id" = %s FOR UPDATE'
+            f'), upd AS ('
+            f'UPDATE {incident_table} AS inc '
+            f'SET "status" = %s, "updated_at" = now() '
+            f'FROM prev WHERE inc."id" = prev."id" '
+            f'RETURNING inc."id", prev."status" AS old_status'
+            f'), ins AS ('
+            f'INSERT INTO {quote_name(StatusUpdate._meta.db_table)} '
+            f'("id", "incident_id", "status", "updated_by_id", "notes", "timestamp") '
+            f'SELECT %s, upd."id", %s, %s, %s, now() FROM upd '
+            f'RETURNING "timestamp"'
+            f') '
+            f'SELECT ins."timestamp", upd.old_status FROM ins, upd'
+        )
+        params = [
+            incident.pk,
+            status,
+            uuid.uuid4(),
+            status,
+            user.pk if user else None,
+            notes,
+        ]
+        
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+        
+        return tuple(row) if row else None
+    
+    @staticmethod
+    def _filter_incidents(filters=None, user=None):
+        """
+        Build the incident queryset visible to a user, with filters applied.
         
         Args:
             filters (dict, optional): Filter parameters (status, reporter_id)
@@ -130,12 +290,6 @@ class IncidentService:
         
         Returns:
             QuerySet: Filtered incidents
-        
-        Example:
-            incidents = IncidentService.get_incidents(
-                filters={'status': 'new'},
-                user=request.user
-            )
         """
         queryset = Incident.objects.all()
         
@@ -149,10 +303,68 @@ class IncidentService:
                 queryset = queryset.filter(reporter_id=filters['reporter_id'])
         
         # If user is public, only show their own incidents
-        if user and not user.is_fire_team() and not user.is_admin_user():
+        if user and not user.is_responder:
             queryset = queryset.filter(reporter=user)
         
-        return queryset.select_related('reporter').prefetch_related('photos', 'status_updates')
+        return queryset
+    
+    @staticmethod
+    def get_incidents_as_dicts(filters=None, user=None):
+        """
+        Get incidents as dicts of the incident list columns.
+        
+        Used by the list endpoint: rows come straight from values(), so no
+        model instances are built. Serialize the rows with
+        IncidentListRowSerializer.
+        
+        Args:
+            filters (dict, optional): Filter parameters (status, reporter_id)
+            user (User, optional): Current user (for permission filtering)
+        
+        Returns:
+            QuerySet: Filtered incidents as dicts
+        """
+        return IncidentService._filter_incidents(filters, user).values(*INCIDENT_LIST_FIELDS)
+    
+    @staticmethod
+    def get_incident_detail_queryset():
+        """
+        Get the incident queryset used for detail responses.
+        
+        Loads everything IncidentDetailSerializer renders in three queries:
+        the incident joined with its reporter, its photos, and its status
+        updates joined with their users (newest first).
+        
+        Returns:
+            QuerySet: Incidents with related data preloaded
+        """
+        return Incident.objects.select_related('reporter').prefetch_related(
+            *IncidentService._detail_prefetches()
+        )
+    
+    @staticmethod
+    def _detail_prefetches():
+        """
+        Build the prefetches for the related data of detail responses.
+        
+        Results are stored as plain lists (photos_list, status_updates_list),
+        so every read of them is a list access rather than a new queryset.
+        
+        Returns:
+            list: Prefetch objects for photos and status updates
+        """
+        return [
+            Prefetch(
+                'photos',
+                queryset=IncidentPhoto.objects.only(*PHOTO_PREFETCH_FIELDS),
+                to_attr='photos_list'
+            ),
+            Prefetch(
+                'status_updates',
+                queryset=StatusUpdate.objects.select_related('updated_by').order_by('-timestamp'),
+                to_attr='status_updates_list'
+            )
+        ]
     
     @staticmethod
     def get_incident_by_id(incident_id):
@@ -166,13 +378,63 @@ class IncidentService:
             Incident or None: Incident instance if found
         """
         try:
-            return Incident.objects.select_related('reporter').prefetch_related(
-                'photos',
-                'status_updates__updated_by'
-            ).get(id=incident_id)
+            return IncidentService.get_incident_detail_queryset().get(id=incident_id)
         except Incident.DoesNotExist:
             return None
     
+    @staticmethod
+    def incident_exists(incident_id):
+        """
+        Check whether an incident exists, without loading it.
+        
+        Args:
+            incident_id (str/UUID): Incident ID
+        
+        Returns:
+            bool: True if the incident exists
+        """
+        return Incident.objects.filter(id=incident_id).exists()
+    
+    @staticmethod
+    def get_incident_for_update(incident_id):
+        """
+        Get a single incident by ID, locking its row until the transaction ends.
+        
+        Must be called inside transaction.atomic(). Concurrent status updates
+        of the same incident wait for each other instead of interleaving.
+        The reporter is joined in, but only the incident row is locked.
+        
+        Args:
+            incident_id (str/UUID): Incident ID
+        
+        Returns:
+            Incident or None: Incident instance if found
+        """
+        return (
+            Incident.objects
+            .select_for_update(of=('self',))
+            .select_related('reporter')
+            .filter(id=incident_id)
+            .first()
+        )
+    
+    @staticmethod
+    def load_incident_detail(incident):
+        """
+        Load the related data rendered by IncidentDetailSerializer.
+        
+        Use on an incident fetched without get_incident_detail_queryset(),
+        e.g. after updating it, to avoid fetching the incident row again.
+        
+        Args:
+            incident (Incident): Incident with its reporter already joined
+        
+        Returns:
+            Incident: The same instance, with photos and status updates loaded
+        """
+        prefetch_related_objects([incident], *IncidentService._detail_prefetches())
+        return incident
+    
     @staticmethod
     def get_dashboard_stats():
         """
@@ -189,29 +451,117 @@ class IncidentService:
                 'total': 22
             }
         """
-        # Count incidents by status
-        status_counts = Incident.objects.values('status').annotate(count=Count('id'))
+        # Large installs can read the denormalized per-status counters
+        if IncidentService.status_counters_enabled():
+            stats = IncidentService._get_dashboard_stats_from_counters()
+            if stats is not None:
+                return stats
         
-        # Initialize counters
-        stats = {
-            'new': 0,
-            'active': 0,
-            'resolved': 0,
-            'total': 0
+        # Bucket the counts in SQL: one query, one row, no Python loop
+        return Incident.objects.aggregate(
+            new=Count('id', filter=Q(status='new')),
+            active=Count('id', filter=Q(status__in=_ACTIVE_STATUSES)),
+            resolved=Count('id', filter=Q(status__in=_RESOLVED_STATUSES)),
+            total=Count('id'),
+        )
+    
+    @staticmethod
+    def _get_dashboard_stats_from_counters():
+        """
+        Build dashboard statistics from IncidentStatusCounter rows.
+        
+        Returns:
+            dict or None: Same as get_dashboard_stats(), or None if the
+            counters have not been initialised for every status
+        """
+        counts = dict(IncidentStatusCounter.objects.values_list('status', 'count'))
+        if counts.keys() != _VALID_STATUSES:
+            return None
+        
+        return {
+            'new': counts['new'],
+            'active': sum(counts[code] for code in _ACTIVE_STATUSES),
+            'resolved': sum(counts[code] for code in _RESOLVED_STATUSES),
+            'total': sum(counts.values()),
         }
+    
+    @staticmethod
+    def status_counters_enabled():
+        """
+        Check whether the per-status counters are maintained and read.
         
-        # Aggregate counts
-        for item in status_counts:
-            status = item['status']
-            count = item['count']
-            
-            if status == 'new':
-                stats['new'] = count
-            elif status in ['enroute', 'arrived', 'fighting']:
-                stats['active'] += count
-            elif status in ['extinguished', 'closed']:
-                stats['resolved'] += count
-            
-            stats['total'] += count
+        Returns:
+            bool: True when DASHBOARD_STATS_USE_COUNTERS is on
+        """
+        return getattr(settings, 'DASHBOARD_STATS_USE_COUNTERS', False)
+    
+    @staticmethod
+    def shift_status_counters(old_status, new_status):
+        """
+        Move one incident between status counters.
+        
+        Args:
+            old_status (str or None): Previous status (None for a new incident)
+            new_status (str or None): New status (None for a deleted incident)
+        """
+        if old_status == new_status:
+            return
+        if old_status is not None:
+            IncidentStatusCounter.objects.filter(status=old_status).update(count=F('count') - 1)
+        if new_status is not None:
+            IncidentStatusCounter.objects.filter(status=new_status).update(count=F('count') + 1)
+    
+    @staticmethod
+    def rebuild_status_counters():
+        """
+        Recount incidents per status and store the results in the counters.
         
-        return stats
+        Use after writes that bypass model signals (bulk_create, update()).
+        """
+        counts = dict(
+            Incident.objects.order_by().values_list('status').annotate(count=Count('id'))
+        )
+        with transaction.atomic():
+            for code, _ in Incident.STATUS_CHOICES:
+                IncidentStatusCounter.objects.update_or_create(
+                    status=code,
+                    defaults={'count': counts.get(code, 0)}
+                )
+    
+    @staticmethod
+    def get_cached_dashboard_stats():
+        """
+        Get dashboard statistics, served from the cache when possible.
+        
+        The cached value lives for DASHBOARD_STATS_CACHE_TIMEOUT seconds and is
+        dropped by the incidents signal handlers whenever an incident changes.
+        
+        Returns:
+            dict: Same as get_dashboard_stats()
+        """
+        return cache.get_or_set(
+            DASHBOARD_STATS_CACHE_KEY,
+            IncidentService.get_dashboard_stats,
+            timeout=DASHBOARD_STATS_CACHE_TIMEOUT
+        )
+    
+    @staticmethod
+    def get_dashboard_stats_etag(stats):
+        """
+        Build an ETag for dashboard statistics.
+        
+        Args:
+            stats (dict): Statistics from get_dashboard_stats()
+        
+        Returns:
+            str: Quoted ETag that changes whenever any count changes
+        """
+        values = ':'.join(f'{key}={stats[key]}' for key in sorted(stats))
+        return f'"{hashlib.sha1(values.encode()).hexdigest()}"'
+    
+    @staticmethod
+    def invalidate_dashboard_stats():
+        """
+        Drop the cached dashboard statistics.
+        """
+        cache.delete(DASHBOARD_STATS_CACHE_KEY)
@@ -0,0 +1,57 @@
+"""
+Signal Handlers for Incidents App
+
+This module keeps cached incident data and the per-status counters in sync
+with the database.
+Handlers are connected in IncidentsConfig.ready().
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from .models import Incident, lock_stored_status
+from .services import IncidentService
+
+
+@receiver(post_save, sender=Incident, dispatch_uid='incidents_stats_on_save')
+@receiver(post_delete, sender=Incident, dispatch_uid='incidents_stats_on_delete')
+def invalidate_dashboard_stats(sender, **kwargs):
+    """
+    Drop the cached dashboard stats when an incident is saved or deleted.
+    """
+    IncidentService.invalidate_dashboard_stats()
+
+
+@receiver(post_save, sender=Incident, dispatch_uid='incidents_counters_on_save')
+def update_status_counters_on_save(sender, instance, **kwargs):
+    """
+    Move the incident to its new status counter after a save.
+    
+    Incident.save() stores the locked previous status in _stored_status
+    when counters are maintained; other saves do not set it.
+    """
+    if '_stored_status' not in instance.__dict__:
+        return
+    old_status = instance.__dict__.pop('_stored_status')
+    IncidentService.shift_status_counters(old_status, instance.status)
+
+
+@receiver(pre_delete, sender=Incident, dispatch_uid='incidents_counters_pre_delete')
+def lock_status_before_delete(sender, instance, **kwargs):
+    """
+    Lock the row and read its stored status before an incident is deleted.
+    
+    Runs inside the deletion's transaction, so concurrent deletes and status
+    changes of the same incident are serialized.
+    """
+    if IncidentService.status_counters_enabled():
+        instance._stored_status = lock_stored_status(instance)
+
+
+@receiver(post_delete, sender=Incident, dispatch_uid='incidents_counters_on_delete')
+def update_status_counters_on_delete(sender, instance, **kwargs):
+    """
+    Remove a deleted incident from its status counter.
+    """
+    stored_status = instance.__dict__.pop('_stored_status', None)
+    if stored_status is not None:
+        IncidentService.shift_status_counters(stored_status, None)
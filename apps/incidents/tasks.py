@@ -0,0 +1,50 @@
+"""
+Background Tasks for Incidents App
+
+This module contains photo post-processing run off the request path
+(see core.background).
+"""
+
+import io
+import logging
+import os
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+from .models import IncidentPhoto
+
+
+logger = logging.getLogger(__name__)
+
+# Longest side of generated thumbnails, in pixels
+THUMBNAIL_SIZE = (320, 320)
+
+
+def generate_thumbnails(incident_id):
+    """
+    Create JPEG thumbnails for the photos of an incident that have none yet.
+    
+    Camera EXIF orientation is applied, and EXIF metadata (including GPS
+    location) is not copied into the thumbnail. Photos that cannot be read
+    are logged and skipped, so they do not stop the others.
+    
+    Args:
+        incident_id (UUID): Incident whose photos are processed
+    """
+    photos = IncidentPhoto.objects.filter(incident_id=incident_id, thumbnail='')
+    
+    for photo in photos:
+        try:
+            with photo.image.open('rb') as image_file, Image.open(image_file) as image:
+                thumbnail = ImageOps.exif_transpose(image).convert('RGB')
+                thumbnail.thumbnail(THUMBNAIL_SIZE)
+                buffer = io.BytesIO()
+                thumbnail.save(buffer, format='JPEG', quality=85)
+        except (OSError, ValueError, Image.DecompressionBombError):
+            # UnidentifiedImageError and truncated files are OSErrors
+            logger.exception('Could not create a thumbnail for photo %s', photo.pk)
+            continue
+        
+        name = os.path.splitext(os.path.basename(photo.image.name))[0] + '.jpg'
+        photo.thumbnail.save(name, ContentFile(buffer.getvalue()), save=False)
+        photo.save(update_fields=['thumbnail'])
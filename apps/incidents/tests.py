@@ -8,28 +8,51 @@ Tests cover:
 - Status updates
 - Permission checks
 - Dashboard statistics
+- JSON rendering
 """
 
-from django.test import TestCase
+import datetime
+import gzip
+import io
+import json
+import shutil
+import tempfile
+import uuid
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils.translation import gettext_lazy
 from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIClient
-from rest_framework import status
+from rest_framework import serializers, status
 from apps.accounts.models import User
 from apps.incidents.models import Incident, StatusUpdate, IncidentPhoto
-from decimal import Decimal
+from apps.incidents.serializers import IncidentDetailSerializer, IncidentListSerializer
+from apps.incidents.services import IncidentService
+from apps.incidents.tasks import generate_thumbnails
+from core.renderers import ORJSONRenderer
+from PIL import Image
+
+
+def make_test_image(name='photo.png'):
+    """Build a small in-memory PNG upload."""
+    buffer = io.BytesIO()
+    Image.new('RGB', (2, 2), color='red').save(buffer, format='PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
 
 
 class IncidentCreationTests(TestCase):
     """Test suite for incident creation."""
     
-    def setUp(self):
-        """Set up test client and users."""
-        self.client = APIClient()
-        self.incidents_url = reverse('incident-list-create')
-        
+    @classmethod
+    def setUpTestData(cls):
+        """Create users and fixtures once for the whole class."""
         # Create test user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             name='Test User',
@@ -38,6 +61,11 @@ class IncidentCreationTests(TestCase):
             user_type='public'
         )
     
+    def setUp(self):
+        """Set up test client and URLs."""
+        self.client = APIClient()
+        self.incidents_url = reverse('incident-list-create')
+    
     def test_create_incident_authenticated_success(self):
         """Test creating incident as authenticated user."""
         self.client.force_authenticate(user=self.user)
@@ -91,6 +119,100 @@ class IncidentCreationTests(TestCase):
         self.assertIsNone(incident.reporter)
         self.assertEqual(incident.reporter_name, 'Anonymous Reporter')
     
+    def test_create_incident_with_photos(self):
+        """Test creating incident with photo uploads stores every photo."""
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        self.client.force_authenticate(user=self.user)
+        
+        data = {
+            'lat': '40.712800',
+            'lng': '-74.006000',
+            'address': '123 Main St, New York, NY',
+            'description': 'Fire in building',
+            'reporter_name': 'Test User',
+            'photos': [make_test_image('one.png'), make_test_image('two.png')]
+        }
+        
+        with override_settings(MEDIA_ROOT=media_root):
+            response = self.client.post(self.incidents_url, data, format='multipart')
+            
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.assertEqual(len(response.data['photos']), 2)
+            photos = IncidentPhoto.objects.filter(incident_id=response.data['id'])
+            self.assertEqual(photos.count(), 2)
+            for photo in photos:
+                self.assertTrue(photo.image.storage.exists(photo.image.name))
+    
+    def test_create_incident_generates_thumbnails_after_commit(self):
+        """Test photo thumbnails are generated after the response, not during it."""
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        self.client.force_authenticate(user=self.user)
+        
+        data = {
+            'lat': '40.712800',
+            'lng': '-74.006000',
+            'address': '123 Main St, New York, NY',
+            'description': 'Fire in building',
+            'reporter_name': 'Test User',
+            'photos': [make_test_image('one.png')]
+        }
+        
+        with override_settings(MEDIA_ROOT=media_root):
+            with self.captureOnCommitCallbacks() as callbacks:
+                response = self.client.post(self.incidents_url, data, format='multipart')
+            
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.assertIsNone(response.data['photos'][0]['thumbnail'])
+            self.assertEqual(len(callbacks), 1)
+            
+            # Run the job inline instead of on the background thread pool
+            generate_thumbnails(response.data['id'])
+            
+            photo = IncidentPhoto.objects.get(incident_id=response.data['id'])
+            self.assertTrue(photo.thumbnail.name.endswith('.jpg'))
+            self.assertTrue(photo.thumbnail.storage.exists(photo.thumbnail.name))
+    
+    @override_settings(DATA_UPLOAD_MAX_NUMBER_FILES=1)
+    def test_create_incident_too_many_photos(self):
+        """Test uploads past the file count limit are rejected."""
+        data = {
+            'lat': '40.712800',
+            'lng': '-74.006000',
+            'address': '123 Main St, New York, NY',
+            'description': 'Fire in building',
+            'photos': [make_test_image('one.png'), make_test_image('two.png')]
+        }
+        
+        response = self.client.post(self.incidents_url, data, format='multipart')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Incident.objects.exists())
+    
+    def test_thumbnails_skip_unreadable_photos(self):
+        """Test a corrupt photo is logged and does not stop the other thumbnails."""
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        
+        with override_settings(MEDIA_ROOT=media_root):
+            incident = Incident.objects.create(
+                lat=40.7128, lng=-74.006, address='123 Main St', description='Fire'
+            )
+            corrupt = IncidentPhoto.objects.create(
+                incident=incident,
+                image=SimpleUploadedFile('corrupt.png', b'not an image', content_type='image/png')
+            )
+            valid = IncidentPhoto.objects.create(incident=incident, image=make_test_image('valid.png'))
+            
+            with self.assertLogs('apps.incidents.tasks', level='ERROR'):
+                generate_thumbnails(incident.id)
+            
+            corrupt.refresh_from_db()
+            valid.refresh_from_db()
+            self.assertEqual(corrupt.thumbnail.name, '')
+            self.assertTrue(valid.thumbnail.name.endswith('.jpg'))
+    
     def test_create_incident_invalid_coordinates(self):
         """Test incident creation fails with invalid coordinates."""
         self.client.force_authenticate(user=self.user)
@@ -124,13 +246,11 @@ class IncidentCreationTests(TestCase):
 class IncidentListingTests(TestCase):
     """Test suite for incident listing and filtering."""
     
-    def setUp(self):
-        """Set up test client, users, and incidents."""
-        self.client = APIClient()
-        self.incidents_url = reverse('incident-list-create')
-        
+    @classmethod
+    def setUpTestData(cls):
+        """Create users and fixtures once for the whole class."""
         # Create public user
-        self.public_user = User.objects.create_user(
+        cls.public_user = User.objects.create_user(
             username='public',
             email='public@example.com',
             name='Public User',
@@ -139,7 +259,7 @@ class IncidentListingTests(TestCase):
         )
         
         # Create fire team user
-        self.fire_team_user = User.objects.create_user(
+        cls.fire_team_user = User.objects.create_user(
             username='fireteam',
             email='fireteam@example.com',
             name='Fire Team',
@@ -148,39 +268,44 @@ class IncidentListingTests(TestCase):
         )
         
         # Create incidents
-        self.incident1 = Incident.objects.create(
-            reporter=self.public_user,
+        cls.incident1 = Incident.objects.create(
+            reporter=cls.public_user,
             reporter_name='Public User',
             reporter_phone='+1234567890',
-            lat=Decimal('40.712800'),
-            lng=Decimal('-74.006000'),
+            lat=40.7128,
+            lng=-74.006,
             address='123 Main St',
             description='Fire 1',
             status='new'
         )
         
-        self.incident2 = Incident.objects.create(
-            reporter=self.public_user,
+        cls.incident2 = Incident.objects.create(
+            reporter=cls.public_user,
             reporter_name='Public User',
             reporter_phone='+1234567890',
-            lat=Decimal('40.712800'),
-            lng=Decimal('-74.006000'),
+            lat=40.7128,
+            lng=-74.006,
             address='456 Oak Ave',
             description='Fire 2',
             status='fighting'
         )
         
-        self.incident3 = Incident.objects.create(
+        cls.incident3 = Incident.objects.create(
             reporter=None,
             reporter_name='Anonymous',
             reporter_phone='+9876543210',
-            lat=Decimal('40.712800'),
-            lng=Decimal('-74.006000'),
+            lat=40.7128,
+            lng=-74.006,
             address='789 Pine St',
             description='Fire 3',
             status='extinguished'
         )
     
+    def setUp(self):
+        """Set up test client and URLs."""
+        self.client = APIClient()
+        self.incidents_url = reverse('incident-list-create')
+    
     def test_list_incidents_fire_team_sees_all(self):
         """Test fire team members can see all incidents."""
         self.client.force_authenticate(user=self.fire_team_user)
@@ -188,7 +313,100 @@ class IncidentListingTests(TestCase):
         response = self.client.get(self.incidents_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertEqual(response.data['results'][0]['lat'], 40.7128)
+        self.assertIsInstance(response.data['results'][0]['lng'], float)
+    
+    def test_list_incidents_query_count_does_not_scale(self):
+        """Test listing takes the same number of queries for more incidents."""
+        self.client.force_authenticate(user=self.fire_team_user)
+        total = Incident.objects.count()
+        
+        for extra in (5, 20):
+            with self.subTest(extra=extra):
+                Incident.objects.bulk_create([
+                    Incident(
+                        reporter=self.public_user,
+                        reporter_name='Public User',
+                        lat=40.7128,
+                        lng=-74.006,
+                        address=f'{number} Elm St',
+                        description='Fire',
+                    )
+                    for number in range(extra)
+                ])
+                total += extra
+                
+                # One SELECT for the page; cursor pagination runs no COUNT
+                with self.assertNumQueries(1):
+                    response = self.client.get(self.incidents_url)
+                
+                self.assertEqual(len(response.data['results']), min(total, 20))
+    
+    def test_list_incidents_cursor_pages_through_all(self):
+        """Test following next links returns every incident exactly once."""
+        self.client.force_authenticate(user=self.fire_team_user)
+        Incident.objects.bulk_create([
+            Incident(
+                reporter=self.public_user,
+                reporter_name='Public User',
+                lat=40.7128,
+                lng=-74.006,
+                address=f'{number} Elm St',
+                description='Fire',
+            )
+            for number in range(25)
+        ])
+        
+        seen = []
+        url = self.incidents_url
+        while url:
+            response = self.client.get(url)
+            self.assertNotIn('count', response.data)
+            seen.extend(row['id'] for row in response.data['results'])
+            url = response.data['next']
+        
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(len(seen), Incident.objects.count())
+    
+    def test_list_incidents_cursor_pages_through_created_at_ties(self):
+        """Test incidents sharing a created_at across page boundaries are all returned."""
+        self.client.force_authenticate(user=self.fire_team_user)
+        Incident.objects.bulk_create([
+            Incident(
+                reporter=self.public_user,
+                reporter_name='Public User',
+                lat=40.7128,
+                lng=-74.006,
+                address=f'{number} Elm St',
+                description='Fire',
+            )
+            for number in range(45)
+        ])
+        Incident.objects.update(
+            created_at=datetime.datetime(2026, 2, 4, 21, 0, tzinfo=datetime.timezone.utc)
+        )
+        
+        seen = []
+        url = self.incidents_url
+        while url:
+            response = self.client.get(url)
+            seen.extend(row['id'] for row in response.data['results'])
+            url = response.data['next']
+        
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(len(seen), Incident.objects.count())
+    
+    def test_list_incidents_selects_list_columns_only(self):
+        """Test the list SELECT only reads the columns the list serializer outputs."""
+        self.client.force_authenticate(user=self.fire_team_user)
+        
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.incidents_url)
+        
+        select_list = queries[-1]['sql'].split(' FROM ')[0]
+        self.assertEqual(select_list.count(','), len(IncidentListSerializer.Meta.fields) - 1)
+        self.assertNotIn('reporter_id', select_list)
     
     def test_list_incidents_public_sees_own_only(self):
         """Test public users only see their own incidents."""
@@ -197,7 +415,7 @@ class IncidentListingTests(TestCase):
         response = self.client.get(self.incidents_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 2)  # Only their 2 incidents
+        self.assertEqual(len(response.data['results']), 2)  # Only their 2 incidents
     
     def test_list_incidents_filter_by_status(self):
         """Test filtering incidents by status."""
@@ -206,7 +424,7 @@ class IncidentListingTests(TestCase):
         response = self.client.get(f'{self.incidents_url}?status=new')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(len(response.data['results']), 1)
         self.assertEqual(response.data['results'][0]['status'], 'new')
     
     def test_list_incidents_search(self):
@@ -216,9 +434,39 @@ class IncidentListingTests(TestCase):
         response = self.client.get(f'{self.incidents_url}?search=Main')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(len(response.data['results']), 1)
         self.assertIn('Main', response.data['results'][0]['address'])
     
+    def test_list_incidents_matches_list_serializer(self):
+        """Test list rows match IncidentListSerializer output."""
+        self.client.force_authenticate(user=self.fire_team_user)
+        
+        response = self.client.get(f'{self.incidents_url}?status=new')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['results'][0],
+            IncidentListSerializer(self.incident1).data
+        )
+    
+    def test_list_serializer_matches_model_serializer(self):
+        """Test the specialized list serializer output equals ModelSerializer's."""
+        serializer = IncidentListSerializer(self.incident1)
+        
+        self.assertEqual(
+            serializer.data,
+            serializers.ModelSerializer.to_representation(serializer, self.incident1)
+        )
+    
+    def test_list_incidents_gzipped_when_accepted(self):
+        """Test list responses are gzip-compressed for clients that accept it."""
+        self.client.force_authenticate(user=self.fire_team_user)
+        
+        response = self.client.get(self.incidents_url, HTTP_ACCEPT_ENCODING='gzip')
+        
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(len(json.loads(gzip.decompress(response.content))['results']), 3)
+    
     def test_list_incidents_unauthenticated_fails(self):
         """Test listing incidents requires authentication."""
         response = self.client.get(self.incidents_url)
@@ -229,12 +477,11 @@ class IncidentListingTests(TestCase):
 class IncidentDetailTests(TestCase):
     """Test suite for incident detail retrieval."""
     
-    def setUp(self):
-        """Set up test client, users, and incident."""
-        self.client = APIClient()
-        
+    @classmethod
+    def setUpTestData(cls):
+        """Create users and fixtures once for the whole class."""
         # Create users
-        self.public_user = User.objects.create_user(
+        cls.public_user = User.objects.create_user(
             username='public',
             email='public@example.com',
             name='Public User',
@@ -242,7 +489,7 @@ class IncidentDetailTests(TestCase):
             user_type='public'
         )
         
-        self.fire_team_user = User.objects.create_user(
+        cls.fire_team_user = User.objects.create_user(
             username='fireteam',
             email='fireteam@example.com',
             name='Fire Team',
@@ -251,30 +498,49 @@ class IncidentDetailTests(TestCase):
         )
         
         # Create incident
-        self.incident = Incident.objects.create(
-            reporter=self.public_user,
+        cls.incident = Incident.objects.create(
+            reporter=cls.public_user,
             reporter_name='Public User',
             reporter_phone='+1234567890',
-            lat=Decimal('40.712800'),
-            lng=Decimal('-74.006000'),
+            lat=40.7128,
+            lng=-74.006,
             address='123 Main St',
             description='Test Fire',
             status='new'
         )
-        
+    
+    def setUp(self):
+        """Set up test client and URLs."""
+        self.client = APIClient()
         self.detail_url = reverse('incident-detail', kwargs={'id': self.incident.id})
     
     def test_get_incident_detail_success(self):
         """Test retrieving incident details."""
         self.client.force_authenticate(user=self.fire_team_user)
         
-        response = self.client.get(self.detail_url)
+        # Incident with reporter, photos, status updates with their users
+        with self.assertNumQueries(3):
+            response = self.client.get(self.detail_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['address'], '123 Main St')
+        self.assertEqual(response.data['lat'], 40.7128)
+        self.assertEqual(response.data['lng'], -74.006)
         self.assertIn('photos', response.data)
         self.assertIn('status_updates', response.data)
     
+    def test_detail_serializer_without_prefetch(self):
+        """Test incidents loaded without the detail prefetches still serialize."""
+        StatusUpdate.objects.create(
+            incident=self.incident, status='new', updated_by=self.fire_team_user
+        )
+        prefetched = IncidentService.get_incident_detail_queryset().get(pk=self.incident.pk)
+        
+        data = IncidentDetailSerializer(Incident.objects.get(pk=self.incident.pk)).data
+        
+        self.assertEqual(data, IncidentDetailSerializer(prefetched).data)
+        self.assertEqual(len(data['status_updates']), 1)
+    
     def test_get_incident_detail_not_found(self):
         """Test retrieving nonexistent incident returns 404."""
         self.client.force_authenticate(user=self.fire_team_user)
@@ -290,12 +556,11 @@ class IncidentDetailTests(TestCase):
 class IncidentStatusUpdateTests(TestCase):
     """Test suite for incident status updates."""
     
-    def setUp(self):
-        """Set up test client, users, and incident."""
-        self.client = APIClient()
-        
+    @classmethod
+    def setUpTestData(cls):
+        """Create users and fixtures once for the whole class."""
         # Create users
-        self.public_user = User.objects.create_user(
+        cls.public_user = User.objects.create_user(
             username='public',
             email='public@example.com',
             name='Public User',
@@ -303,7 +568,7 @@ class IncidentStatusUpdateTests(TestCase):
             user_type='public'
         )
         
-        self.fire_team_user = User.objects.create_user(
+        cls.fire_team_user = User.objects.create_user(
             username='fireteam',
             email='fireteam@example.com',
             name='Fire Team',
@@ -312,17 +577,20 @@ class IncidentStatusUpdateTests(TestCase):
         )
         
         # Create incident
-        self.incident = Incident.objects.create(
-            reporter=self.public_user,
+        cls.incident = Incident.objects.create(
+            reporter=cls.public_user,
             reporter_name='Public User',
             reporter_phone='+1234567890',
-            lat=Decimal('40.712800'),
-            lng=Decimal('-74.006000'),
+            lat=40.7128,
+            lng=-74.006,
             address='123 Main St',
             description='Test Fire',
             status='new'
         )
-        
+    
+    def setUp(self):
+        """Set up test client and URLs."""
+        self.client = APIClient()
         self.status_url = reverse('incident-status-update', kwargs={'id': self.incident.id})
     
     def test_update_status_fire_team_success(self):
@@ -338,6 +606,7 @@ class IncidentStatusUpdateTests(TestCase):
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['status'], 'fighting')
+        self.assertEqual(response.data['status_updates'][0]['notes'], 'Team on scene')
         
         # Verify database was updated
         self.incident.refresh_from_db()
@@ -351,6 +620,29 @@ class IncidentStatusUpdateTests(TestCase):
         self.assertIsNotNone(status_update)
         self.assertEqual(status_update.notes, 'Team on scene')
     
+    def test_update_status_does_not_refetch_incident(self):
+        """Test the locked incident is reused for the response instead of reloaded."""
+        self.client.force_authenticate(user=self.fire_team_user)
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(self.status_url, {'status': 'enroute'}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        incident_selects = [
+            query for query in queries
+            if query['sql'].startswith('SELECT') and 'FROM "incidents_incident"' in query['sql']
+        ]
+        self.assertEqual(len(incident_selects), 1)
+    
+    def test_update_status_not_found(self):
+        """Test updating a nonexistent incident returns 404."""
+        self.client.force_authenticate(user=self.fire_team_user)
+        url = reverse('incident-status-update', kwargs={'id': uuid.uuid4()})
+        
+        response = self.client.patch(url, {'status': 'enroute'}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
     def test_update_status_public_user_forbidden(self):
         """Test public users cannot update incident status."""
         self.client.force_authenticate(user=self.public_user)
@@ -381,12 +673,11 @@ class IncidentStatusUpdateTests(TestCase):
 class StatusHistoryTests(TestCase):
     """Test suite for incident status history."""
     
-    def setUp(self):
-        """Set up test client, users, and incident with history."""
-        self.client = APIClient()
-        
+    @classmethod
+    def setUpTestData(cls):
+        """Create users and fixtures once for the whole class."""
         # Create user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='fireteam',
             email='fireteam@example.com',
             name='Fire Team',
@@ -395,12 +686,12 @@ class StatusHistoryTests(TestCase):
         )
         
         # Create incident
-        self.incident = Incident.objects.create(
-            reporter=self.user,
+        cls.incident = Incident.objects.create(
+            reporter=cls.user,
             reporter_name='Fire Team',
             reporter_phone='+1234567890',
-            lat=Decimal('40.712800'),
-            lng=Decimal('-74.006000'),
+            lat=40.7128,
+            lng=-74.006,
             address='123 Main St',
             description='Test Fire',
             status='fighting'
@@ -408,47 +699,110 @@ class StatusHistoryTests(TestCase):
         
         # Create status updates
         StatusUpdate.objects.create(
-            incident=self.incident,
+            incident=cls.incident,
             status='new',
-            updated_by=self.user,
+            updated_by=cls.user,
             notes='Reported'
         )
         StatusUpdate.objects.create(
-            incident=self.incident,
+            incident=cls.incident,
             status='enroute',
-            updated_by=self.user,
+            updated_by=cls.user,
             notes='Team dispatched'
         )
         StatusUpdate.objects.create(
-            incident=self.incident,
+            incident=cls.incident,
             status='fighting',
-            updated_by=self.user,
+            updated_by=cls.user,
             notes='On scene'
         )
-        
+    
+    def setUp(self):
+        """Set up test client and URLs."""
+        self.client = APIClient()
         self.history_url = reverse('incident-status-history', kwargs={'id': self.incident.id})
     
     def test_get_status_history_success(self):
         """Test retrieving incident status history."""
         self.client.force_authenticate(user=self.user)
         
-        response = self.client.get(self.history_url)
+        # One COUNT for pagination, one SELECT joined with the updating users
+        with self.assertNumQueries(2):
+            response = self.client.get(self.history_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Should have 3 manual updates
         self.assertGreaterEqual(len(response.data), 3)
+    
+    def test_status_history_includes_updater(self):
+        """Test each update names the user who made it, or null if anonymous."""
+        StatusUpdate.objects.create(
+            incident=self.incident,
+            status='arrived',
+            updated_by=None,
+            notes='Anonymous update'
+        )
+        self.client.force_authenticate(user=self.user)
+        
+        response = self.client.get(self.history_url)
+        
+        updates = {update['notes']: update for update in response.data['results']}
+        self.assertEqual(updates['On scene']['updated_by_id'], str(self.user.id))
+        self.assertEqual(updates['On scene']['updated_by_name'], 'Fire Team')
+        self.assertIsNone(updates['Anonymous update']['updated_by_id'])
+        self.assertIsNone(updates['Anonymous update']['updated_by_name'])
+    
+    def test_status_history_later_pages_reuse_cached_count(self):
+        """Test only the first page recounts; later pages use the cached count."""
+        cache.clear()
+        StatusUpdate.objects.bulk_create([
+            StatusUpdate(incident=self.incident, status='fighting', notes=f'Update {number}')
+            for number in range(25)
+        ])
+        self.client.force_authenticate(user=self.user)
+        
+        with self.assertNumQueries(2):
+            first_page = self.client.get(self.history_url)
+        
+        # The count comes from the cache, only the page itself is selected
+        with self.assertNumQueries(1):
+            second_page = self.client.get(first_page.data['next'])
+        
+        self.assertEqual(second_page.status_code, status.HTTP_200_OK)
+        self.assertEqual(second_page.data['count'], first_page.data['count'])
+    
+    def test_status_history_page_size_is_capped(self):
+        """Test clients can set the page size, but not above the maximum."""
+        StatusUpdate.objects.bulk_create([
+            StatusUpdate(incident=self.incident, status='fighting', notes=f'Update {number}')
+            for number in range(105)
+        ])
+        self.client.force_authenticate(user=self.user)
+        
+        small_page = self.client.get(self.history_url, {'page_size': 5})
+        capped_page = self.client.get(self.history_url, {'page_size': 100000})
+        
+        self.assertEqual(len(small_page.data['results']), 5)
+        self.assertEqual(len(capped_page.data['results']), 100)
+    
+    def test_get_status_history_incident_not_found(self):
+        """Test history of a nonexistent incident returns 404."""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('incident-status-history', kwargs={'id': uuid.uuid4()})
+        
+        response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
 
 class DashboardStatsTests(TestCase):
     """Test suite for dashboard statistics."""
     
-    def setUp(self):
-        """Set up test client, users, and incidents."""
-        self.client = APIClient()
-        self.stats_url = reverse('dashboard-stats')
-        
+    @classmethod
+    def setUpTestData(cls):
+        """Create users and fixtures once for the whole class."""
         # Create users
-        self.public_user = User.objects.create_user(
+        cls.public_user = User.objects.create_user(
             username='public',
             email='public@example.com',
             name='Public User',
@@ -456,7 +810,7 @@ class DashboardStatsTests(TestCase):
             user_type='public'
         )
         
-        self.fire_team_user = User.objects.create_user(
+        cls.fire_team_user = User.objects.create_user(
             username='fireteam',
             email='fireteam@example.com',
             name='Fire Team',
@@ -464,49 +818,36 @@ class DashboardStatsTests(TestCase):
             user_type='fire_team'
         )
         
-        # Create incidents with different statuses
-        Incident.objects.create(
-            reporter=self.public_user,
-            reporter_name='User',
-            lat=Decimal('40.712800'),
-            lng=Decimal('-74.006000'),
-            address='Address 1',
-            description='Fire 1',
-            status='new'
-        )
-        Incident.objects.create(
-            reporter=self.public_user,
-            reporter_name='User',
-            lat=Decimal('40.712800'),
-            lng=Decimal('-74.006000'),
-            address='Address 2',
-            description='Fire 2',
-            status='new'
-        )
-        Incident.objects.create(
-            reporter=self.public_user,
-            reporter_name='User',
-            lat=Decimal('40.712800'),
-            lng=Decimal('-74.006000'),
-            address='Address 3',
-            description='Fire 3',
-            status='fighting'
-        )
-        Incident.objects.create(
-            reporter=self.public_user,
-            reporter_name='User',
-            lat=Decimal('40.712800'),
-            lng=Decimal('-74.006000'),
-            address='Address 4',
-            description='Fire 4',
-            status='extinguished'
-        )
+        # Create incidents with different statuses in one INSERT
+        Incident.objects.bulk_create([
+            Incident(
+                reporter=cls.public_user,
+                reporter_name='User',
+                lat=40.7128,
+                lng=-74.006,
+                address=f'Address {number}',
+                description=f'Fire {number}',
+                status=incident_status
+            )
+            for number, incident_status in enumerate(
+                ['new', 'new', 'fighting', 'extinguished'], start=1
+            )
+        ])
+    
+    def setUp(self):
+        """Set up test client and URLs."""
+        # Fixtures are bulk-created (no post_save), so drop any cached stats
+        cache.clear()
+        self.client = APIClient()
+        self.stats_url = reverse('dashboard-stats')
     
     def test_get_stats_fire_team_success(self):
         """Test fire team can access dashboard stats."""
         self.client.force_authenticate(user=self.fire_team_user)
         
-        response = self.client.get(self.stats_url)
+        # All buckets come from a single conditional aggregate
+        with self.assertNumQueries(1):
+            response = self.client.get(self.stats_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['new'], 2)
@@ -514,6 +855,79 @@ class DashboardStatsTests(TestCase):
         self.assertEqual(response.data['resolved'], 1)  # extinguished
         self.assertEqual(response.data['total'], 4)
     
+    def test_get_stats_cached_until_incident_changes(self):
+        """Test stats are served from cache and refreshed after an incident changes."""
+        self.client.force_authenticate(user=self.fire_team_user)
+        self.client.get(self.stats_url)
+        
+        with self.assertNumQueries(0):
+            response = self.client.get(self.stats_url)
+        self.assertEqual(response.data['new'], 2)
+        
+        incident = Incident.objects.filter(status='new').first()
+        IncidentService.update_incident_status(incident, 'enroute', self.fire_team_user)
+        
+        response = self.client.get(self.stats_url)
+        self.assertEqual(response.data['new'], 1)
+        self.assertEqual(response.data['active'], 2)
+    
+    @override_settings(DASHBOARD_STATS_USE_COUNTERS=True)
+    def test_get_stats_from_status_counters(self):
+        """Test stats read from the status counters follow status changes."""
+        # Fixtures are bulk-created (no post_save), so recount them first
+        IncidentService.rebuild_status_counters()
+        
+        with self.assertNumQueries(1):
+            stats = IncidentService.get_dashboard_stats()
+        self.assertEqual(stats, {'new': 2, 'active': 1, 'resolved': 1, 'total': 4})
+        
+        incident = Incident.objects.filter(status='new').first()
+        IncidentService.update_incident_status(incident, 'enroute', self.fire_team_user)
+        incident.delete()
+        
+        stats = IncidentService.get_dashboard_stats()
+        self.assertEqual(stats, {'new': 1, 'active': 1, 'resolved': 1, 'total': 3})
+    
+    @override_settings(DASHBOARD_STATS_USE_COUNTERS=True)
+    def test_status_counters_use_stored_status_for_stale_instances(self):
+        """Test saving a stale copy moves the incident out of its stored status."""
+        IncidentService.rebuild_status_counters()
+        incident_id = Incident.objects.filter(status='new').values_list('id', flat=True).first()
+        first = Incident.objects.get(pk=incident_id)
+        stale = Incident.objects.get(pk=incident_id)
+        
+        first.status = 'enroute'
+        first.save()
+        stale.status = 'fighting'
+        stale.save()
+        
+        stats = IncidentService.get_dashboard_stats()
+        self.assertEqual(stats, {'new': 1, 'active': 2, 'resolved': 1, 'total': 4})
+    
+    def test_status_counters_not_maintained_when_disabled(self):
+        """Test incident saves skip the counter updates when counters are off."""
+        incident = Incident.objects.filter(status='new').first()
+        incident.status = 'enroute'
+        
+        with self.assertNumQueries(1):
+            incident.save(update_fields=['status'])
+    
+    def test_get_stats_not_modified_for_matching_etag(self):
+        """Test polling with the last ETag returns 304 until the stats change."""
+        self.client.force_authenticate(user=self.fire_team_user)
+        etag = self.client.get(self.stats_url)['ETag']
+        
+        response = self.client.get(self.stats_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+        
+        incident = Incident.objects.filter(status='new').first()
+        IncidentService.update_incident_status(incident, 'enroute', self.fire_team_user)
+        
+        response = self.client.get(self.stats_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+    
     def test_get_stats_public_user_forbidden(self):
         """Test public users cannot access dashboard stats."""
         self.client.force_authenticate(user=self.public_user)
@@ -527,3 +941,51 @@ class DashboardStatsTests(TestCase):
         response = self.client.get(self.stats_url)
         
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class JSONRenderingTests(TestCase):
+    """Test suite for the orjson response renderer and request parser."""
+    
+    def test_renders_same_json_as_drf_renderer(self):
+        """Test orjson output decodes to the same data as DRF's JSONRenderer."""
+        data = {
+            'id': uuid.uuid4(),
+            'lat': 40.7128,
+            'lng': -74.006,
+            'status_label': gettext_lazy('Fighting Fire'),
+            'created_at': datetime.datetime(2026, 2, 4, 21, 0, tzinfo=datetime.timezone.utc),
+            'photos': [],
+        }
+        
+        self.assertEqual(
+            json.loads(ORJSONRenderer().render(data)),
+            json.loads(JSONRenderer().render(data))
+        )
+    
+    def test_incident_endpoints_use_orjson(self):
+        """Test incident responses are rendered by ORJSONRenderer."""
+        user = User.objects.create_user(
+            username='fireteam',
+            email='fireteam@example.com',
+            name='Fire Team',
+            password='testpass123',
+            user_type='fire_team'
+        )
+        client = APIClient()
+        client.force_authenticate(user=user)
+        
+        response = client.get(reverse('incident-list-create'))
+        
+        self.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+        self.assertEqual(response['Content-Type'], 'application/json')
+    
+    def test_malformed_json_body_rejected(self):
+        """Test a malformed JSON request body is a 400 parse error."""
+        response = APIClient().post(
+            reverse('incident-list-create'),
+            data=b'{"lat": 40.7128,',
+            content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('JSON parse error', response.data['detail'])
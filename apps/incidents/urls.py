@@ -1,7 +1,8 @@
 """
 URL Configuration for Incidents App
 
-Defines incident management and dashboard endpoints.
+Defines incident management endpoints. The dashboard stats endpoint is
+mounted in core/urls.py.
 """
 
 from django.urls import path
@@ -10,7 +11,6 @@ from .views import (
     IncidentDetailView,
     IncidentStatusUpdateView,
     IncidentStatusHistoryView,
-    DashboardStatsView,
 )
 
 urlpatterns = [
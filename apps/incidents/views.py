@@ -5,16 +5,22 @@ This module contains DRF views for incident management.
 Views handle HTTP requests/responses and delegate business logic to services.
 """
 
+from django.db import transaction
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from core.pagination import CreatedAtCursorPagination
+from core.parsers import ORJSONParser
 from rest_framework import status, generics, filters
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from .models import Incident, StatusUpdate
+from rest_framework.parsers import MultiPartParser, FormParser
+from .models import StatusUpdate
 from .serializers import (
     IncidentListSerializer,
     IncidentDetailSerializer,
     IncidentStatusUpdateSerializer,
+    IncidentListRowSerializer,
     StatusUpdateSerializer
 )
 from .services import IncidentService
@@ -28,7 +34,7 @@ class IncidentListCreateView(generics.ListCreateAPIView):
     GET /api/incidents/
     - List all incidents (fire team sees all, public users see only their own)
     - Supports filtering by status
-    - Supports pagination
+    - Supports cursor pagination (next/previous links, no total count)
     
     POST /api/incidents/
     - Create a new incident report
@@ -38,26 +44,45 @@ class IncidentListCreateView(generics.ListCreateAPIView):
     
     serializer_class = IncidentListSerializer
     permission_classes = [IsFireTeamOrReadOnly]
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    pagination_class = CreatedAtCursorPagination
+    parser_classes = [MultiPartParser, FormParser, ORJSONParser]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['address', 'description', 'reporter_name']
     ordering_fields = ['created_at', 'updated_at', 'status']
-    ordering = ['-created_at']
+    ordering = ['-created_at', '-id']
     
     def get_queryset(self):
         """
         Get incidents based on user permissions and filters.
+        
+        Returns values() rows with only the list columns: the list
+        serializer renders no relations, so nothing is joined or prefetched.
+        """
+        # Get incidents using service
+        return IncidentService.get_incidents_as_dicts(
+            filters=self._get_filters(),
+            user=self.request.user if self.request.user.is_authenticated else None
+        )
+    
+    def _get_filters(self):
+        """
+        Get filter parameters from the query string.
         """
-        # Get filter parameters
         filters = {}
         if self.request.query_params.get('status'):
             filters['status'] = self.request.query_params.get('status')
+        return filters
+    
+    def get_serializer_class(self):
+        """
+        Serialize listed rows with the dict-based list serializer.
         
-        # Get incidents using service
-        return IncidentService.get_incidents(
-            filters=filters,
-            user=self.request.user if self.request.user.is_authenticated else None
-        )
+        The rows have exactly the IncidentListSerializer fields, so the
+        response is unchanged while skipping model and serializer overhead.
+        """
+        if self.request.method == 'GET':
+            return IncidentListRowSerializer
+        return super().get_serializer_class()
     
     def create(self, request, *args, **kwargs):
         """
@@ -92,7 +117,7 @@ class IncidentListCreateView(generics.ListCreateAPIView):
             return Response(errors, status=status.HTTP_400_BAD_REQUEST)
         
         # Return detailed incident data
-        serializer = IncidentDetailSerializer(incident)
+        serializer = IncidentDetailSerializer(IncidentService.load_incident_detail(incident))
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
@@ -112,7 +137,7 @@ class IncidentDetailView(generics.RetrieveAPIView):
     
     def get_queryset(self):
         """Get all incidents (permissions handled by permission class)."""
-        return Incident.objects.all()
+        return IncidentService.get_incident_detail_queryset()
 
 
 class IncidentStatusUpdateView(APIView):
@@ -143,35 +168,37 @@ class IncidentStatusUpdateView(APIView):
             403: Permission denied
             404: Incident not found
         """
-        # Get incident
-        incident = IncidentService.get_incident_by_id(id)
-        
-        if not incident:
-            return Response(
-                {'error': 'Incident not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
         # Validate request data
         serializer = IncidentStatusUpdateSerializer(data=request.data)
         
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         
-        # Update status using service
-        updated_incident, errors = IncidentService.update_incident_status(
-            incident=incident,
-            status=serializer.validated_data['status'],
-            user=request.user,
-            notes=serializer.validated_data.get('notes', '')
-        )
+        with transaction.atomic():
+            # Lock the incident so concurrent updates are applied one at a time
+            incident = IncidentService.get_incident_for_update(id)
+            
+            if not incident:
+                return Response(
+                    {'error': 'Incident not found'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            
+            # Update status using service
+            updated_incident, errors = IncidentService.update_incident_status(
+                incident=incident,
+                status=serializer.validated_data['status'],
+                user=request.user,
+                notes=serializer.validated_data.get('notes', '')
+            )
         
         if errors:
             return Response(errors, status=status.HTTP_400_BAD_REQUEST)
         
-        # Return updated incident
+        # Return updated incident, with related data loaded after the update
+        # so it includes the new status update
         return Response(
-            IncidentDetailSerializer(updated_incident).data,
+            IncidentDetailSerializer(IncidentService.load_incident_detail(updated_incident)).data,
             status=status.HTTP_200_OK
         )
 
@@ -194,6 +221,28 @@ class IncidentStatusHistoryView(generics.ListAPIView):
         return StatusUpdate.objects.filter(
             incident_id=incident_id
         ).select_related('updated_by').order_by('-timestamp')
+    
+    def list(self, request, *args, **kwargs):
+        """
+        List status updates, or return 404 if the incident does not exist.
+        
+        Every incident has at least its initial status update, so the
+        existence check only runs when the page comes back empty.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else queryset
+        
+        if not rows and not IncidentService.incident_exists(self.kwargs.get('id')):
+            return Response(
+                {'error': 'Incident not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        serializer = self.get_serializer(rows, many=True)
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
 
 
 class DashboardStatsView(APIView):
@@ -220,5 +269,15 @@ class DashboardStatsView(APIView):
                 "total": 22
             }
         """
-        stats = IncidentService.get_dashboard_stats()
-        return Response(stats, status=status.HTTP_200_OK)
+        stats = IncidentService.get_cached_dashboard_stats()
+        etag = IncidentService.get_dashboard_stats_etag(stats)
+        
+        # Polling clients that already have these numbers get an empty 304
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(stats, status=status.HTTP_200_OK)
+        
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
@@ -0,0 +1,53 @@
+"""
+Background Tasks for Fire Watcher API
+
+This module runs short, non-critical jobs (such as generating photo
+thumbnails) on a small in-process thread pool, after the surrounding
+transaction commits, so they stay off the request/response path.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.db import connection, transaction
+
+
+logger = logging.getLogger(__name__)
+
+# Threads shared by all background jobs in this process
+BACKGROUND_TASK_WORKERS = 2
+
+_executor = ThreadPoolExecutor(
+    max_workers=BACKGROUND_TASK_WORKERS,
+    thread_name_prefix='background-task'
+)
+
+
+def _run(func, args, kwargs):
+    """
+    Run a job in a worker thread, logging failures and closing its connection.
+    """
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logger.exception('Background task %s failed', getattr(func, '__name__', func))
+    finally:
+        # Each worker thread has its own database connection
+        connection.close()
+
+
+def submit_on_commit(func, *args, **kwargs):
+    """
+    Run func(*args, **kwargs) in the background once the transaction commits.
+    
+    Outside a transaction the job is submitted immediately. Jobs are lost if
+    the process exits before they run, so only use this for work that can be
+    redone later.
+    
+    Args:
+        func (callable): Job to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+    """
+    transaction.on_commit(partial(_executor.submit, _run, func, args, kwargs))
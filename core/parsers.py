@@ -0,0 +1,33 @@
+"""
+Custom Parsers for Fire Watcher API
+
+This module contains the JSON parser used for all API requests.
+It replaces DRF's JSONParser, which decodes with the standard library
+json module, with orjson.
+"""
+
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from .renderers import ORJSONRenderer
+
+
+class ORJSONParser(BaseParser):
+    """
+    ORJSON Parser
+    
+    Parses JSON request bodies with orjson. Like DRF's parser in its default
+    strict mode, NaN and Infinity are rejected.
+    """
+    
+    media_type = 'application/json'
+    renderer_class = ORJSONRenderer
+    
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parse the incoming bytestream as JSON and return the resulting data.
+        """
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
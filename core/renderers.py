@@ -0,0 +1,43 @@
+"""
+Custom Renderers for Fire Watcher API
+
+This module contains the JSON renderer used for all API responses.
+It replaces DRF's JSONRenderer, which encodes with the standard library
+json module, with orjson.
+"""
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+# DRF's encoder handles the types orjson does not (Decimal, lazy strings, ...)
+_fallback_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    ORJSON Renderer
+    
+    Renders response data to JSON with orjson, which is several times faster
+    than the standard library for large payloads and serializes UUIDs and
+    datetimes natively. Naive datetimes are treated as UTC and UTC datetimes
+    use the "Z" suffix, matching DRF's DateTimeField output.
+    """
+    
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render data into JSON bytes.
+        """
+        if data is None:
+            return b''
+        
+        return orjson.dumps(
+            data,
+            default=_fallback_encoder.default,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+        )
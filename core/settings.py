@@ -6,21 +6,37 @@ It includes database configuration, installed apps, middleware, authentication,
 and REST framework settings.
 """
 
+import os
 from pathlib import Path
 from datetime import timedelta
 
+import django
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 
 # SECURITY WARNING: keep the secret key used in production secret!
-# TODO: Move this to environment variables in production
-SECRET_KEY = 'django-insecure-change-this-in-production-fire-watcher-api-key'
+# Set DJANGO_SECRET_KEY in production; the fallback is for development only.
+DEVELOPMENT_SECRET_KEY = 'django-insecure-change-this-in-production-fire-watcher-api-key'
+SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY', DEVELOPMENT_SECRET_KEY)
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
-
-ALLOWED_HOSTS = ['*']
+# Off unless DJANGO_DEBUG=1 (set it for local development).
+DEBUG = os.environ.get('DJANGO_DEBUG') == '1'
+
+# Admin sessions are signed cookies (see SESSION_ENGINE), so anyone holding
+# the secret key could forge them: the public development key is refused
+# when DEBUG is off.
+if not DEBUG and SECRET_KEY == DEVELOPMENT_SECRET_KEY:
+    raise ImproperlyConfigured('Set DJANGO_SECRET_KEY when DEBUG is off.')
+
+# Comma-separated host names, e.g. "api.example.com,www.example.com".
+# Any host is accepted when unset (development only).
+ALLOWED_HOSTS = [
+    host.strip() for host in os.environ.get('ALLOWED_HOSTS', '*').split(',') if host.strip()
+]
 
 
 # Application definition
@@ -45,8 +61,18 @@ INSTALLED_APPS = [
     'apps.incidents',  # Fire incident reporting and management
 ]
 
+# Every middleware below except WhiteNoise is both sync and async capable.
+# WhiteNoise is sync only, which costs nothing under WSGI; under ASGI it is
+# removed (see ASGI_SERVER below) and the reverse proxy serves static files,
+# so the stack runs without sync/async adapter switches. Sessions and
+# messages stay because the admin requires them.
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',  # Static files - right after SecurityMiddleware
+    # Gzip responses of 200+ bytes for clients that accept it. Placed above all
+    # middleware that reads or changes the body, so it compresses the final
+    # content; Django adds random padding to mitigate BREACH.
+    'django.middleware.gzip.GZipMiddleware',
     'corsheaders.middleware.CorsMiddleware',  # CORS - must be before CommonMiddleware
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -58,11 +84,14 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'core.urls'
 
+# The API only renders JSON; the admin is the only user of templates, so the
+# loader searches its template directory alone instead of every installed app.
+# Form widgets are rendered by the form renderer's own engine and are unaffected.
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [],
-        'APP_DIRS': True,
+        'DIRS': [Path(django.__file__).resolve().parent / 'contrib' / 'admin' / 'templates'],
+        'APP_DIRS': False,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
@@ -75,16 +104,115 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'core.wsgi.application'
+ASGI_APPLICATION = 'core.asgi.application'
 
 
 # Database
-# Using SQLite for development - switch to PostgreSQL for production
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# PostgreSQL when POSTGRES_DB is set (production), SQLite otherwise (local
+# development). SQLite serializes all writes behind one database lock, so
+# it is not suitable for concurrent API traffic.
+POSTGRES_DB = os.environ.get('POSTGRES_DB')
+
+if POSTGRES_DB:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': POSTGRES_DB,
+            'USER': os.environ.get('POSTGRES_USER', 'postgres'),
+            'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+            'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
+            'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+            # Keep connections open between requests instead of reconnecting
+            # (TCP, TLS and auth handshakes) on every request, and check a
+            # reused connection is still alive before the request uses it.
+            # Put pgbouncer in transaction pooling mode in front of the
+            # database as well.
+            'CONN_MAX_AGE': 600,
+            'CONN_HEALTH_CHECKS': True,
+            # QuerySet.iterator() streams through server-side cursors, which
+            # do not survive pgbouncer transaction pooling: set
+            # POSTGRES_BEHIND_PGBOUNCER=1 there to fall back to client cursors.
+            'DISABLE_SERVER_SIDE_CURSORS': bool(os.environ.get('POSTGRES_BEHIND_PGBOUNCER')),
+            'OPTIONS': {
+                'sslmode': os.environ.get('POSTGRES_SSLMODE', 'require'),
+            },
+        }
     }
-}
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+            'CONN_MAX_AGE': 600,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                # WAL lets readers keep working while a write is in progress;
+                # NORMAL sync is safe in WAL mode. 64 MB page cache, 256 MB mmap.
+                'init_command': (
+                    'PRAGMA journal_mode=WAL;'
+                    'PRAGMA synchronous=NORMAL;'
+                    'PRAGMA cache_size=-64000;'
+                    'PRAGMA mmap_size=268435456;'
+                    'PRAGMA temp_store=MEMORY;'
+                ),
+                # Take the write lock when a transaction starts, so concurrent
+                # writers wait (up to the busy timeout) instead of failing
+                # with "database is locked" when upgrading a read lock
+                'transaction_mode': 'IMMEDIATE',
+            },
+        }
+    }
+
+# ASGI deployment
+# Set ASGI_SERVER=1 when serving core.asgi with uvicorn or daphne. The views
+# stay sync (DRF has no async views) and run in a thread per request, so the
+# event loop keeps accepting connections while they wait on the database.
+# Each request may run in a different thread, so persistent connections
+# would pile up: connect per request and pool in pgbouncer instead.
+if os.environ.get('ASGI_SERVER'):
+    MIDDLEWARE.remove('whitenoise.middleware.WhiteNoiseMiddleware')
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+
+
+# Cache
+# Redis when REDIS_URL is set, so all workers share dashboard stats, cached
+# pagination counts and token revocations. Without it each process keeps its
+# own local-memory cache, which is only suitable for a single process.
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+
+
+# Sessions
+# Only the admin uses sessions (the API authenticates with JWTs). Keeping the
+# session in a signed cookie means no session table lookup on any request.
+# Cookies are signed with SECRET_KEY, which is therefore required outside
+# debug mode (see above).
+SESSION_ENGINE = 'django.contrib.sessions.backends.signed_cookies'
+
+
+# Password hashing
+# Argon2id (native C implementation via argon2-cffi) is used for new hashes.
+# PBKDF2 stays in the list so existing hashes keep verifying and are
+# transparently upgraded to Argon2 on the user's next successful login.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
+# Argon2 cost parameters, applied in AccountsConfig.ready().
+# Calibrate on the production host so a single hash takes ~50-100ms:
+# raise ARGON2_TIME_COST until the target is reached, keeping memory fixed.
+ARGON2_TIME_COST = 3
+ARGON2_MEMORY_COST = 32768  # KiB (32 MiB)
+ARGON2_PARALLELISM = 1
 
 
 # Password validation
@@ -112,33 +240,83 @@ USE_TZ = True
 
 
 # Static files (CSS, JavaScript, Images)
+# Collected files are served by WhiteNoise, compressed and with
+# content-hashed names so they can be cached forever by clients and proxies
 STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
 # Media files (User uploaded content)
+# Served by Django only in development; in production let the reverse proxy
+# serve MEDIA_ROOT directly (see README)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Uploads larger than this are spooled to a temporary file on disk instead of
+# being held in memory (phone photos are usually several MB). Saving a
+# temporary upload with FileSystemStorage moves the file rather than copying it.
+FILE_UPLOAD_MAX_MEMORY_SIZE = 256 * 1024  # 256 KB
+
+# Request bodies are bounded in memory: non-file data (JSON bodies and form
+# fields) is capped here, and each photo holds at most 256 KB before spooling,
+# so a multipart request buffers at most DATA_UPLOAD_MAX_NUMBER_FILES * 256 KB.
+# Limit the total body size at the reverse proxy (client_max_body_size).
+DATA_UPLOAD_MAX_MEMORY_SIZE = 1024 * 1024  # 1 MB
+DATA_UPLOAD_MAX_NUMBER_FILES = 10
+
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 
+# Dashboard statistics
+# Read per-status counts from the denormalized IncidentStatusCounter table
+# instead of counting the incidents table. Worth enabling once the table is
+# large. Counters are only maintained while this is on, so recount them when
+# enabling it:
+#   python manage.py shell -c "from apps.incidents.services import IncidentService; IncidentService.rebuild_status_counters()"
+DASHBOARD_STATS_USE_COUNTERS = False
+
+
 # Custom User Model
 # Using a custom user model for flexibility in user management
 AUTH_USER_MODEL = 'accounts.User'
 
+# Authentication backends
+# LeanModelBackend only loads the user columns needed to log in
+AUTHENTICATION_BACKENDS = [
+    'apps.accounts.backends.LeanModelBackend',
+]
+
 
 # REST Framework Configuration
 REST_FRAMEWORK = {
-    # Use JSON renderer by default
+    # Use JSON renderer by default (orjson-backed, see core/renderers.py)
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'core.renderers.ORJSONRenderer',
+    ],
+    
+    # Parse JSON bodies with orjson as well (see core/parsers.py)
+    'DEFAULT_PARSER_CLASSES': [
+        'core.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
     
     # Authentication classes - JWT is primary
+    # (rejects access tokens revoked at logout; revocations are stored in the
+    # Django cache, so use a shared cache backend when running several workers;
+    # verified tokens and their users are reused for a few seconds per process)
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.accounts.auth.CachedJWTAuthentication',
     ],
     
     # Permission classes - require authentication by default
@@ -147,14 +325,14 @@ REST_FRAMEWORK = {
     ],
     
     # Pagination settings
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    # (page numbers with a cached total count, see core/pagination.py)
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.CachedCountPagination',
     'PAGE_SIZE': 20,
     
     # Filtering and search
-    'DEFAULT_FILTER_BACKENDS': [
-        'rest_framework.filters.SearchFilter',
-        'rest_framework.filters.OrderingFilter',
-    ],
+    # No global backends: views that search or order declare filter_backends
+    # themselves, so detail and history views skip the backends entirely
+    'DEFAULT_FILTER_BACKENDS': [],
 }
 
 
@@ -169,17 +347,59 @@ SIMPLE_JWT = {
     'BLACKLIST_AFTER_ROTATION': True,
     
     # Algorithm and signing
+    # HS256 is the cheapest option to verify, and CachedJWTAuthentication
+    # skips verification for recently seen tokens. Switch to EdDSA (below)
+    # only if other services must verify tokens without the signing secret.
+    # The key is passed as bytes so it is not re-encoded for every token.
     'ALGORITHM': 'HS256',
-    'SIGNING_KEY': SECRET_KEY,
+    'SIGNING_KEY': os.environ.get('JWT_SIGNING_KEY', SECRET_KEY).encode(),
     
     # Token claims
     'AUTH_HEADER_TYPES': ('Bearer',),
     'USER_ID_FIELD': 'id',
     'USER_ID_CLAIM': 'user_id',
+    
+    # Reject refresh tokens revoked at logout from the cache first
+    'TOKEN_REFRESH_SERIALIZER': 'apps.accounts.auth.RevocationAwareTokenRefreshSerializer',
 }
 
+# Asymmetric signing (optional)
+# If the tokens must be verifiable by other services, sign with Ed25519
+# rather than RS256: EdDSA signs and verifies several times faster and uses
+# much smaller keys, though each verification still costs more than HS256.
+# Point both variables at PEM files, e.g. generated with
+#   openssl genpkey -algorithm ed25519 -out jwt_private.pem
+#   openssl pkey -in jwt_private.pem -pubout -out jwt_public.pem
+# Requires the cryptography package (djangorestframework-simplejwt[crypto]).
+# The PEM files are parsed once here: simplejwt prepares the configured keys
+# on every sign/verify, and key objects are used as they are.
+JWT_PRIVATE_KEY_PATH = os.environ.get('JWT_PRIVATE_KEY_PATH')
+JWT_PUBLIC_KEY_PATH = os.environ.get('JWT_PUBLIC_KEY_PATH')
+
+if JWT_PRIVATE_KEY_PATH and JWT_PUBLIC_KEY_PATH:
+    from cryptography.hazmat.primitives.serialization import (
+        load_pem_private_key,
+        load_pem_public_key,
+    )
+    
+    SIMPLE_JWT.update({
+        'ALGORITHM': 'EdDSA',
+        'SIGNING_KEY': load_pem_private_key(Path(JWT_PRIVATE_KEY_PATH).read_bytes(), password=None),
+        'VERIFYING_KEY': load_pem_public_key(Path(JWT_PUBLIC_KEY_PATH).read_bytes()),
+    })
+
 
 # CORS Configuration
-# Allow all origins in development - restrict in production
-CORS_ALLOW_ALL_ORIGINS = True
+# Set CORS_ALLOWED_ORIGINS to a comma-separated list of frontend origins in
+# production; all origins are allowed when it is unset (development only).
+CORS_ALLOWED_ORIGINS = [
+    origin.strip() for origin in os.environ.get('CORS_ALLOWED_ORIGINS', '').split(',') if origin.strip()
+]
+CORS_ALLOW_ALL_ORIGINS = not CORS_ALLOWED_ORIGINS
 CORS_ALLOW_CREDENTIALS = True
+
+# If the reverse proxy adds the CORS headers and answers preflight requests
+# itself, set CORS_AT_PROXY=1 to drop django-cors-headers from the stack.
+if os.environ.get('CORS_AT_PROXY'):
+    INSTALLED_APPS.remove('corsheaders')
+    MIDDLEWARE.remove('corsheaders.middleware.CorsMiddleware')
@@ -0,0 +1,58 @@
+"""
+Django settings for running the test suite.
+
+Extends the main settings with overrides that only make sense under test.
+manage.py selects this module automatically for the `test` command.
+"""
+
+import os
+
+# The main settings refuse the development secret key when DEBUG is off
+os.environ.setdefault('DJANGO_SECRET_KEY', 'test-secret-key-not-for-production')
+
+from .settings import *  # noqa: F401,F403,E402
+
+
+# Password hashing
+# Hash strength is not under test; MD5 keeps fixture creation cheap
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+
+# Database
+# Always an in-memory SQLite database (Django already uses one for SQLite
+# test runs; this also covers runs where the main settings use PostgreSQL)
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+
+# Migrations
+# Build the test schema straight from the models instead of replaying every
+# migration. Set TEST_RUN_MIGRATIONS=1 (e.g. in CI) to run them as usual.
+class DisableMigrations:
+    """Report every app as having no migrations module."""
+    
+    def __contains__(self, app_label):
+        return True
+    
+    def __getitem__(self, app_label):
+        return None
+
+
+if not os.environ.get('TEST_RUN_MIGRATIONS'):
+    MIGRATION_MODULES = DisableMigrations()
+
+
+# Static files
+# Tests do not run collectstatic, so there is no manifest to look names up in
+STORAGES = {
+    **STORAGES,  # noqa: F405
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
@@ -13,6 +13,7 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
+from apps.incidents.views import DashboardStatsView
 
 urlpatterns = [
     # Django Admin - for backend management
@@ -21,7 +22,10 @@ urlpatterns = [
     # API endpoints
     path('api/auth/', include('apps.accounts.urls')),  # Authentication endpoints
     path('api/incidents/', include('apps.incidents.urls')),  # Incident endpoints
-    path('api/dashboard/', include('apps.incidents.urls_dashboard')),  # Dashboard endpoints
+    # Dashboard stats, served from the cache (see IncidentService.get_cached_dashboard_stats).
+    # Mounted directly rather than through a one-route include, so resolving
+    # it does not descend into a nested resolver
+    path('api/dashboard/stats/', DashboardStatsView.as_view(), name='dashboard-stats'),
 ]
 
 # Serve media files in development